@@ -5,12 +5,12 @@ NiftyGateway Scraper Configuration
 # Scraper settings
 DEFAULT_MAX_ITEMS = 1000  # Increased for production
 DEFAULT_MAX_SCROLLS = 50  # Increased for production
-DEFAULT_SCROLL_PAUSE_TIME = 1.0  # Reduced for speed
 DEFAULT_WAIT_TIMEOUT = 10
 
 # Browser settings
 HEADLESS_MODE = True  # Default to headless for production
 WINDOW_SIZE = "1920,1080"
+LOAD_IMAGES = False  # Set True to see images when debugging with a visible browser
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
 # URL patterns
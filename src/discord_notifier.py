@@ -5,28 +5,83 @@ Sends alerts when profitable NFT arbitrage opportunities are found
 
 import requests
 import json
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Per-flag embed color, title and explanation line, built once at import
+ARBITRAGE_COLORS = {
+    '🔥 RED': 0xFF0000,    # Red
+    '🟡 YELLOW': 0xFFFF00, # Yellow
+    '🟢 GREEN': 0x00FF00   # Green
+}
+ARBITRAGE_TITLES = {flag: f"{flag} ARBITRAGE OPPORTUNITY" for flag in ARBITRAGE_COLORS}
+ARBITRAGE_BLURBS = {
+    '🔥 RED': "🚀 **INSTANT PROFIT** - OpenSea offer >= Nifty price!",
+    '🟡 YELLOW': "⚡ **STRONG OPPORTUNITY** - Within 10% of Nifty price",
+    '🟢 GREEN': "💡 **MODERATE OPPORTUNITY** - Within 20% of Nifty price"
+}
+ARBITRAGE_FOOTER = {
+    "text": "NiftyGateway Arbitrage Bot",
+    "icon_url": "https://cdn.discordapp.com/embed/avatars/0.png"
+}
+
 class DiscordNotifier:
-    def __init__(self, webhook_url: str):
+    __slots__ = ('webhook_url', 'batch_delay', '_pending', '_pending_lock', '_send_lock', '_flush_timer', 'session')
+    
+    def __init__(self, webhook_url: str, batch_delay: float = 2.0):
         """
         Initialize Discord notifier with webhook URL
         
         Args:
             webhook_url: Discord webhook URL for sending messages
+            batch_delay: Seconds to collect arbitrage alerts into one message (0 = send each immediately)
         """
         self.webhook_url = webhook_url
         
+        # Alerts queued within batch_delay of the first one share a single webhook post
+        self.batch_delay = batch_delay
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._flush_timer = None
+        
+        # Reuse one keep-alive connection to the webhook across alerts, backing
+        # off on rate limits (429 honours Discord's Retry-After). Only 429 is
+        # retried: a 5xx or a slow reply may come after Discord already accepted
+        # the POST, and re-sending it would duplicate the alert
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=(429,),
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False
+            )
+        ))
+        
     def send_arbitrage_alert(self, item_data: Dict[str, Any]) -> bool:
         """
         Send arbitrage opportunity alert to Discord
         
+        Alerts are batched: they go out at most batch_delay seconds after the
+        first queued one, or as soon as 10 are waiting, in a single message.
+        
         Args:
             item_data: Item data with arbitrage information
             
         Returns:
-            True if message sent successfully, False otherwise
+            True if the alert was queued or sent successfully, False otherwise
         """
         try:
             # Only send alerts for profitable opportunities
@@ -37,27 +92,61 @@ class DiscordNotifier:
             # Build the Discord embed message
             embed = self._build_arbitrage_embed(item_data)
             
-            payload = {
-                "embeds": [embed]
-            }
-            
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'}
-            )
+            with self._pending_lock:
+                self._pending.append(embed)
+                send_now = self.batch_delay <= 0 or len(self._pending) >= MAX_EMBEDS_PER_MESSAGE
+                if not send_now and self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.batch_delay, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
             
-            if response.status_code == 204:
-                print(f"🚀 Discord alert sent: {arbitrage_flag} opportunity")
-                return True
-            else:
-                print(f"❌ Discord notification failed: {response.status_code}")
-                return False
+            if send_now:
+                return self.flush()
+            return True
                 
         except Exception as e:
             print(f"❌ Discord notification error: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Send every queued arbitrage alert, up to 10 embeds per message
+        
+        Returns:
+            True if all queued alerts were sent successfully, False otherwise
+        """
+        # Held for the whole post loop so a flush from the timer thread and one
+        # from the caller (e.g. right before the summary) can't interleave
+        with self._send_lock:
+            with self._pending_lock:
+                embeds, self._pending = self._pending, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            
+            all_sent = True
+            for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                batch = embeds[start:start + MAX_EMBEDS_PER_MESSAGE]
+                try:
+                    response = self.session.post(
+                        self.webhook_url,
+                        json={"embeds": batch},
+                        headers={'Content-Type': 'application/json'},
+                        timeout=(5, 10)
+                    )
+                    
+                    if response.status_code == 204:
+                        print(f"🚀 Discord alert sent: {len(batch)} opportunit{'y' if len(batch) == 1 else 'ies'}")
+                    else:
+                        print(f"❌ Discord notification failed: {response.status_code}")
+                        all_sent = False
+                
+                except Exception as e:
+                    print(f"❌ Discord notification error: {e}")
+                    all_sent = False
+            
+            return all_sent
+    
     def _build_arbitrage_embed(self, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Build Discord embed for arbitrage opportunity
@@ -85,42 +174,22 @@ class DiscordNotifier:
         nifty_url = item_data.get('actual_marketplace_url', '')
         opensea_url = item_data.get('opensea_item_url', '')
         
-        # Set embed color based on opportunity level
-        colors = {
-            '🔥 RED': 0xFF0000,    # Red
-            '🟡 YELLOW': 0xFFFF00, # Yellow  
-            '🟢 GREEN': 0x00FF00   # Green
-        }
-        color = colors.get(arbitrage_flag, 0x808080)
-        
-        # Build title and description
-        title = f"{arbitrage_flag} ARBITRAGE OPPORTUNITY"
-        
-        description = f"**{collection_name}** #{token_id}\n"
-        description += f"💰 **Profit: ${potential_profit_usd:+.2f} ({profit_percentage:+.1f}%)**\n\n"
-        
-        # Price comparison
-        description += f"📈 **NiftyGateway**: ${floor_price:.2f}\n"
-        description += f"📊 **OpenSea Offer**: {offer_eth:.4f} ETH (${offer_usd:.2f})"
-        
-        if quantity > 1:
-            description += f" - {quantity}x quantity"
-        
-        description += "\n\n"
-        
-        # Opportunity explanation  
-        if arbitrage_flag == '🔥 RED':
-            description += "🚀 **INSTANT PROFIT** - OpenSea offer >= Nifty price!"
-        elif arbitrage_flag == '🟡 YELLOW':
-            description += "⚡ **STRONG OPPORTUNITY** - Within 10% of Nifty price"
-        elif arbitrage_flag == '🟢 GREEN':
-            description += "💡 **MODERATE OPPORTUNITY** - Within 20% of Nifty price"
+        # Build the description in one pass: summary, price comparison and
+        # the per-flag explanation
+        quantity_text = f" - {quantity}x quantity" if quantity > 1 else ""
+        description = (
+            f"**{collection_name}** #{token_id}\n"
+            f"💰 **Profit: ${potential_profit_usd:+.2f} ({profit_percentage:+.1f}%)**\n\n"
+            f"📈 **NiftyGateway**: ${floor_price:.2f}\n"
+            f"📊 **OpenSea Offer**: {offer_eth:.4f} ETH (${offer_usd:.2f}){quantity_text}\n\n"
+            f"{ARBITRAGE_BLURBS.get(arbitrage_flag, '')}"
+        )
         
         # Build embed
         embed = {
-            "title": title,
+            "title": ARBITRAGE_TITLES.get(arbitrage_flag) or f"{arbitrage_flag} ARBITRAGE OPPORTUNITY",
             "description": description,
-            "color": color,
+            "color": ARBITRAGE_COLORS.get(arbitrage_flag, 0x808080),
             "timestamp": datetime.utcnow().isoformat(),
             "fields": [
                 {
@@ -139,10 +208,7 @@ class DiscordNotifier:
                     "inline": False
                 }
             ],
-            "footer": {
-                "text": "NiftyGateway Arbitrage Bot",
-                "icon_url": "https://cdn.discordapp.com/embed/avatars/0.png"
-            }
+            "footer": ARBITRAGE_FOOTER
         }
         
         return embed
@@ -167,10 +233,11 @@ class DiscordNotifier:
             
             payload = {"embeds": [embed]}
             
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                headers={'Content-Type': 'application/json'},
+                timeout=(5, 10)
             )
             
             return response.status_code == 204
@@ -194,16 +261,21 @@ class DiscordNotifier:
             True if message sent successfully, False otherwise
         """
         try:
-            description = f"**Scanning Session Complete**\n\n"
-            description += f"📊 **Items Processed**: {total_processed:,}\n"
-            description += f"💎 **Opportunities Found**: {opportunities_found}\n\n"
-            
             if opportunities_found > 0:
-                description += f"🔥 **RED (Excellent)**: {red_flags}\n"
-                description += f"🟡 **YELLOW (Good)**: {yellow_flags}\n"
-                description += f"🟢 **GREEN (Fair)**: {green_flags}\n"
+                breakdown = (
+                    f"🔥 **RED (Excellent)**: {red_flags}\n"
+                    f"🟡 **YELLOW (Good)**: {yellow_flags}\n"
+                    f"🟢 **GREEN (Fair)**: {green_flags}\n"
+                )
             else:
-                description += "No arbitrage opportunities found this scan."
+                breakdown = "No arbitrage opportunities found this scan."
+            
+            description = (
+                f"**Scanning Session Complete**\n\n"
+                f"📊 **Items Processed**: {total_processed:,}\n"
+                f"💎 **Opportunities Found**: {opportunities_found}\n\n"
+                f"{breakdown}"
+            )
             
             embed = {
                 "title": "📈 Scanning Summary",
@@ -217,10 +289,11 @@ class DiscordNotifier:
             
             payload = {"embeds": [embed]}
             
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
-                headers={'Content-Type': 'application/json'}
+                headers={'Content-Type': 'application/json'},
+                timeout=(5, 10)
             )
             
             return response.status_code == 204
@@ -228,3 +301,8 @@ class DiscordNotifier:
         except Exception as e:
             print(f"❌ Summary notification error: {e}")
             return False
+    
+    def close(self):
+        """Send any queued alerts and close the webhook connection pool"""
+        self.flush()
+        self.session.close()
@@ -1,11 +1,24 @@
 import time
+import csv
 import json
 import re
 import os
+import functools
+import itertools
+import sqlite3
+import threading
+import multiprocessing
+import multiprocessing.util
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -13,9 +26,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+
+import config
 
 # Import OpenSea API client and offers client
 try:
@@ -25,9 +39,314 @@ except ImportError:
     OpenSeaAPIClient = None
     OpenSeaOffersClient = None
 
+# Faster JSON encoder when available (falls back to the json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Precompiled patterns shared by the extraction helpers
+_RE_CONTRACT = re.compile(r'/marketplace/(?:collectible|collection)/([a-fA-F0-9x]+)(?:/(\d+))?')
+_RE_PRICE = re.compile(r'\$([0-9,]+\.?[0-9]*)')
+_RE_ITEM_TOK = re.compile(r'/marketplace/item/[^/]+/(\d+)/')
+# Price, item count and floor label in a single left-to-right scan of card text
+_RE_CARD_TOKENS = re.compile(
+    r'\$(?P<price>[0-9,]+\.?[0-9]*)|(?P<items>\d+)\s*[Ii]tems|(?P<floor>[Ff][Ll][Oo][Oo][Rr])'
+)
+_RE_HASH_TOK = re.compile(r'#(\d+)(?:\s*/\s*\d+)?')  # "#8666 / 15045", "#8666/15045", "#8666"
+_RE_CREATOR = re.compile(r'creator:', re.IGNORECASE)
+_RE_SLASH_TOK = re.compile(r'^(\d+)\s*/|(\d+)\s*/\s*\d+')  # "28 / ..." at the start, else "28 / 100" anywhere
+
+# Thousands separators dropped from captured prices before float()
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+# Cell texts meaning "not listed" in the List Price column
+_NO_LISTING = frozenset({'--', '-', '', 'N/A', 'n/a'})
+
+# Collection pages fetched ahead over HTTP while the current one is parsed
+HTTP_PREFETCH_WINDOW = 8
+
+# Complete listings waiting on (or finished with) OpenSea enrichment at any time
+ENRICH_AHEAD_WINDOW = 4
+
+# Resources the scraper never reads, blocked in the browser to cut page-load time
+BLOCKED_IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg"]
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.mp4", "*.webm", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    # Third-party analytics and tag scripts
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*segment.com*", "*hotjar.com*", "*intercom.io*", "*sentry.io*",
+]
+
+# href, heading and parent container text of an item card link (arguments[0])
+CARD_FIELDS_JS = """
+const link = arguments[0];
+const container = link.parentElement || link;
+const heading = container.querySelector('h1, h2, h3');
+return {
+    href: link.href || link.getAttribute('href') || '',
+    title: (heading && heading.innerText.trim()) || null,
+    text: container.innerText || ''
+};
+"""
+
+# First marketplace item for the first matching selector in arguments[0]:
+# selector used, match count, item link href and item text
+FIRST_MARKET_ITEM_JS = """
+for (const selector of arguments[0]) {
+    const items = document.querySelectorAll(selector);
+    if (!items.length) continue;
+    const item = items[0];
+    let href = item.href || item.getAttribute('href') || '';
+    if (!href) {
+        const link = item.querySelector("a[href*='/marketplace/item/']");
+        href = link ? link.href : '';
+    }
+    return {selector: selector, count: items.length, href: href, text: item.innerText || ''};
+}
+return null;
+"""
+
+# Cheapest (first) marketplace table row: item link, row text, cell texts and table headers.
+# Falls back to the first bare item link when the page has no table row.
+CHEAPEST_ROW_JS = """
+const row = document.querySelector("tbody tr, [class*='MuiTableBody'] tr");
+if (!row) {
+    const link = document.querySelector("[href*='/marketplace/item/']");
+    return link ? {row: false, href: link.href || link.getAttribute('href') || ''} : null;
+}
+const link = row.querySelector("a[href*='/marketplace/item/']");
+// Headers of the row's own table only (native <th> and MUI head cells)
+const table = row.closest("table, [class*='MuiTable-root']");
+return {
+    row: true,
+    href: link ? link.href : '',
+    text: row.innerText,
+    // Native <tr>.cells needs no selector matching; div-based MUI rows fall back to the class query
+    cells: Array.from(
+        row.cells && row.cells.length ? row.cells : row.querySelectorAll(".MuiTableCell-root, [class*='MuiTableCell']"),
+        c => c.innerText
+    ),
+    headers: table ? Array.from(
+        table.querySelectorAll("th, [class*='MuiTableHead'] [class*='MuiTableCell']"),
+        h => h.innerText.trim().toLowerCase()
+    ) : []
+};
+"""
+
+COLLECTION_LINK_SELECTOR = "[href*='/marketplace/collection/']"
+COUNT_ELEMENTS_JS = "return document.querySelectorAll(arguments[0]).length;"
+LISTING_ROW_SELECTOR = "table tbody tr, a[href*='/marketplace/item/']"
+
+# "Load More" buttons: attribute/class matches, then visible button text
+LOAD_MORE_CSS = "button[data-testid='load-more'], [data-testid='load-more-button'], .load-more, button[class*='load'], button[class*='more']"
+LOAD_MORE_XPATH = "//button[contains(normalize-space(.), 'Load More') or contains(normalize-space(.), 'Show More')]"
+
+# Scroll to the bottom (or click arguments[1]) and resolve as soon as new
+# collection links are added to the DOM, or after arguments[0] milliseconds
+SCROLL_AND_WAIT_JS = """
+const done = arguments[arguments.length - 1];
+const timeoutMs = arguments[0];
+const clickTarget = arguments[1];
+const selector = "[href*='/marketplace/collection/']";
+const count = () => document.querySelectorAll(selector).length;
+const before = count();
+let finished = false;
+let observer = null;
+const finish = (loaded) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    done({loaded: loaded, before: before, after: count()});
+};
+observer = new MutationObserver(() => {
+    if (count() > before) finish(true);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+if (clickTarget) {
+    clickTarget.click();
+} else {
+    window.scrollTo(0, document.body.scrollHeight);
+}
+setTimeout(() => finish(false), timeoutMs);
+"""
+
+# Scroll down by arguments[0] pixels and report link count, page height and
+# scroll position in the same round-trip
+SCROLL_BY_JS = """
+window.scrollTo(0, window.pageYOffset + arguments[0]);
+return {
+    n: document.querySelectorAll("[href*='/marketplace/collection/']").length,
+    h: document.body.scrollHeight,
+    y: window.pageYOffset
+};
+"""
+
+# Cheap fingerprint of the collection link list: count, page height and last href
+LINK_STATE_JS = """
+const links = document.querySelectorAll("a[href*='/marketplace/collection/']");
+return [links.length, document.body.scrollHeight, links.length ? links[links.length - 1].href : ''];
+"""
+
+# Every collection link href with query string and fragment removed
+COLLECTION_HREFS_JS = """
+return Array.from(
+    document.querySelectorAll("a[href*='/marketplace/collection/']"),
+    a => a.origin + a.pathname  // drops ?query and #fragment without splitting
+);
+"""
+
+# Like COLLECTION_HREFS_JS, but only hrefs not returned by an earlier call on
+# this page; arguments[0] = true clears the page-side seen-set first
+NEW_COLLECTION_HREFS_JS = """
+if (arguments[0] || !window.__niftySeenHrefs) window.__niftySeenHrefs = new Set();
+const seen = window.__niftySeenHrefs;
+const fresh = [];
+for (const a of document.querySelectorAll("a[href*='/marketplace/collection/']")) {
+    const href = a.origin + a.pathname;
+    if (seen.has(href)) continue;
+    seen.add(href);
+    fresh.push(href);
+}
+return fresh;
+"""
+
+
+# ChromeDriver binary resolved once per interpreter
+_DRIVER_PATH: Optional[str] = None
+
+
+def _get_driver_path() -> str:
+    """
+    Resolve the ChromeDriver binary, checking webdriver-manager at most once per process
+    
+    Uses the system ChromeDriver from CHROMEDRIVER_PATH in Docker and falls back
+    to webdriver-manager locally. The resolved path is exported back to
+    CHROMEDRIVER_PATH so pool workers started later skip the version check.
+    
+    Returns:
+        Path to the ChromeDriver executable
+    """
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+        if chromedriver_path and os.path.exists(chromedriver_path):
+            # Docker environment with manually installed ChromeDriver
+            print(f"🐳 Using Docker ChromeDriver: {chromedriver_path}")
+        else:
+            # Local environment - use webdriver-manager
+            chromedriver_path = ChromeDriverManager().install()
+            os.environ['CHROMEDRIVER_PATH'] = chromedriver_path
+            print("💻 Using webdriver-manager for local development")
+        _DRIVER_PATH = chromedriver_path
+    return _DRIVER_PATH
+
+
+def items_stable(min_count: int = 1):
+    """
+    Build a WebDriverWait condition for a settled list of collection links
+    
+    Args:
+        min_count: Minimum number of collection links required
+        
+    Returns:
+        Callable that returns the link count once at least min_count links are
+        present and the count is unchanged since the previous poll, else False
+    """
+    last_count = -1
+    
+    def condition(driver):
+        nonlocal last_count
+        count = driver.execute_script(COUNT_ELEMENTS_JS, COLLECTION_LINK_SELECTOR)
+        settled = count >= max(min_count, 1) and count == last_count
+        last_count = count
+        return count if settled else False
+    
+    return condition
+
+
+def _json_line(item: Dict) -> bytes:
+    """
+    Serialize one item as a UTF-8 JSON line
+    
+    Args:
+        item: Item dictionary
+        
+    Returns:
+        JSON bytes terminated by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+
+def save_items_to_ndjson(items: List[Dict], filename: str = None):
+    """
+    Save items as newline-delimited JSON, one item per line
+    
+    Args:
+        items: Item dictionaries to write
+        filename: Output file; defaults to a timestamped name in the working directory
+    """
+    try:
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"nifty_gateway_items_{timestamp}.ndjson"
+        
+        if items:
+            with open(filename, 'wb', buffering=1 << 16) as f:
+                for item in items:
+                    f.write(_json_line(item))
+            print(f"✅ Data saved to {filename}")
+        else:
+            print("⚠️  No data to save")
+            
+    except Exception as e:
+        print(f"❌ Failed to save NDJSON file: {e}")
+
+
+def links_added(before: int):
+    """
+    Build a WebDriverWait condition for new collection links appearing
+    
+    Args:
+        before: Collection link count to exceed
+        
+    Returns:
+        Callable that returns the new link count once it exceeds before, else False
+    """
+    def condition(driver):
+        count = driver.execute_script(COUNT_ELEMENTS_JS, COLLECTION_LINK_SELECTOR)
+        return count if count > before else False
+    
+    return condition
+
+
+def cheapest_row_rendered(driver):
+    """
+    WebDriverWait condition for a cheapest listing row whose price cell has rendered
+    
+    Args:
+        driver: Selenium WebDriver on a collection page
+        
+    Returns:
+        The CHEAPEST_ROW_JS result once it shows a price (or an explicit
+        "no listing" marker, or only a bare item link), else False
+    """
+    row = driver.execute_script(CHEAPEST_ROW_JS)
+    if not row:
+        return False
+    if not row.get('row') or '$' in (row.get('text') or ''):
+        return row
+    cells = [cell.strip() for cell in row.get('cells') or []]
+    if any(cell and cell in _NO_LISTING for cell in cells):
+        return row
+    return False
+
 
 class NiftyGatewayScraper:
-    def __init__(self, headless: bool = False, enable_opensea_enrichment: bool = True, enable_arbitrage_analysis: bool = True, arbitrage_callback=None):
+    def __init__(self, headless: bool = False, enable_opensea_enrichment: bool = True, enable_arbitrage_analysis: bool = True, arbitrage_callback=None, http_fast_path: bool = True, workers: Optional[int] = None, stream_path: Optional[str] = None, verbose: bool = True, cache_path: Optional[str] = None, cache_ttl: float = 60, opensea_client=None, offers_client=None):
         """
         Initialize the NiftyGateway scraper
         
@@ -36,11 +355,60 @@ class NiftyGatewayScraper:
             enable_opensea_enrichment: Whether to enrich items with OpenSea collection data
             enable_arbitrage_analysis: Whether to analyze arbitrage opportunities
             arbitrage_callback: Optional callback function for real-time arbitrage notifications
+            http_fast_path: Whether to try plain HTTP for collection pages before using the browser
+            workers: Number of worker processes for collection pages (default: MORPH_PROCESSES env var, or 1)
+            stream_path: Optional JSON Lines file each saved item is appended to as soon as it is scraped
+            verbose: Whether to print per-URL and per-scroll-step progress lines
+            cache_path: Optional SQLite file caching collection page results between runs
+            cache_ttl: Seconds a cached collection page result stays valid (keep short: it holds a live listing price)
+            opensea_client: Existing OpenSeaAPIClient to use instead of creating one (shares its rate limit and cache)
+            offers_client: Existing OpenSeaOffersClient to use instead of creating one (shares its rate limit)
         """
         self.driver = None
         self.headless = headless
+        self._closed = False  # Set by close(); stops in-flight work from relaunching the browser
+        self.verbose = verbose
         self.scraped_items = []
         
+        # Incremental output so a crash mid-scrape keeps everything saved so far
+        self.stream_path = stream_path
+        self._stream_file = None
+        
+        # Collection page results reused across runs until they are cache_ttl old
+        # (connection opened on first use, so the scraper can be re-entered after close())
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self._cache = None
+        
+        # Plain HTTP fast path for collection pages (Selenium stays as fallback)
+        self.http_fast_path = http_fast_path
+        self.http_session = requests.Session()
+        self.http_session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "text/html,application/xhtml+xml",
+        })
+        # Keep-alive pool large enough for every prefetch request in flight,
+        # with a quick retry on transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_PREFETCH_WINDOW,
+            pool_maxsize=HTTP_PREFETCH_WINDOW,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=("GET",))
+        )
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
+        self.http_shell_pages = 0  # Consecutive JS-only responses
+        
+        # Each worker process owns one headless browser
+        if workers is None:
+            env_workers = os.environ.get('MORPH_PROCESSES', '1')
+            try:
+                workers = int(env_workers)
+            except ValueError:
+                print(f"⚠️  Invalid MORPH_PROCESSES value {env_workers!r}, using 1 worker")
+                workers = 1
+        self.workers = max(1, workers)
+        self._pool = None
+        
         # OpenSea enrichment
         self.enable_opensea_enrichment = enable_opensea_enrichment
         self.opensea_client = None
@@ -50,7 +418,9 @@ class NiftyGatewayScraper:
         self.offers_client = None
         self.arbitrage_callback = arbitrage_callback
         
-        if self.enable_opensea_enrichment and OpenSeaAPIClient:
+        if self.enable_opensea_enrichment and opensea_client is not None:
+            self.opensea_client = opensea_client
+        elif self.enable_opensea_enrichment and OpenSeaAPIClient:
             try:
                 self.opensea_client = OpenSeaAPIClient()
                 print("🔗 OpenSea enrichment enabled")
@@ -61,7 +431,9 @@ class NiftyGatewayScraper:
             print("⚠️  OpenSea client not available, enrichment disabled")
             self.enable_opensea_enrichment = False
         
-        if self.enable_arbitrage_analysis and OpenSeaOffersClient:
+        if self.enable_arbitrage_analysis and offers_client is not None:
+            self.offers_client = offers_client
+        elif self.enable_arbitrage_analysis and OpenSeaOffersClient:
             try:
                 self.offers_client = OpenSeaOffersClient()
                 print("💎 Arbitrage analysis enabled")
@@ -73,12 +445,19 @@ class NiftyGatewayScraper:
             self.enable_arbitrage_analysis = False
         
     def setup_driver(self):
-        """Set up Chrome WebDriver with options"""
+        """Set up Chrome WebDriver with options (no-op once close() was called)"""
+        if self._closed:
+            print("⏹️  Scraper is closed - not starting a new WebDriver")
+            return
+        
         try:
             chrome_options = Options()
 
             if self.headless:
                 chrome_options.add_argument("--headless")
+            
+            # Return from driver.get at DOMContentLoaded; explicit waits cover the rest
+            chrome_options.page_load_strategy = 'eager'
 
             # Essential stability flags
             chrome_options.add_argument("--no-sandbox")
@@ -92,11 +471,12 @@ class NiftyGatewayScraper:
             
             # Core stability flags (tested and working)
             chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
             chrome_options.add_argument("--disable-plugins")
             chrome_options.add_argument("--disable-background-timer-throttling")
             chrome_options.add_argument("--disable-backgrounding-occluded-windows")
             chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-features=TranslateUI")
+            chrome_options.add_argument("--disable-features=TranslateUI,LazyImageLoading")
             chrome_options.add_argument("--disable-web-security")
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             
@@ -113,20 +493,35 @@ class NiftyGatewayScraper:
             # Crash resistance
             chrome_options.add_argument("--disable-crash-reporter")
             chrome_options.add_argument("--disable-in-process-stack-traces")
+            
+            # Skip bytes we never read: images and notification prompts (web fonts
+            # are blocked by URL pattern below; config.LOAD_IMAGES turns images
+            # back on for visual debugging)
+            prefs = {
+                "profile.default_content_setting_values.notifications": 2,
+            }
+            if not config.LOAD_IMAGES:
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                prefs["profile.managed_default_content_settings.images"] = 2
+            chrome_options.add_experimental_option("prefs", prefs)
 
-            # Use system ChromeDriver in Docker, fallback to webdriver-manager locally
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
-            if chromedriver_path and os.path.exists(chromedriver_path):
-                # Docker environment with manually installed ChromeDriver
-                service = Service(chromedriver_path)
-                print(f"🐳 Using Docker ChromeDriver: {chromedriver_path}")
-            else:
-                # Local environment - use webdriver-manager
-                service = Service(ChromeDriverManager().install())
-                print("💻 Using webdriver-manager for local development")
+            service = Service(_get_driver_path())
 
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
+            # No implicit wait: probes for optional elements should fail fast,
+            # real waits are explicit WebDriverWait calls
+            self.driver.implicitly_wait(0)
+            
+            # Block images, media, fonts and third-party trackers at the network layer as well
+            blocked_urls = BLOCKED_RESOURCE_PATTERNS
+            if not config.LOAD_IMAGES:
+                blocked_urls = BLOCKED_IMAGE_PATTERNS + blocked_urls
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+            except Exception as e:
+                print(f"⚠️  Could not block heavy resources: {e}")
+            
             print("✅ WebDriver setup successful")
             
         except Exception as e:
@@ -134,6 +529,25 @@ class NiftyGatewayScraper:
             print("⚠️  Continuing without WebDriver - some functions may not work")
             self.driver = None
         
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_contract(url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Parse contract address and token ID from a NiftyGateway URL (memoized)
+        
+        Args:
+            url: NiftyGateway marketplace URL
+            
+        Returns:
+            Tuple of (contract, token_id, url_type); all None if the URL does not match
+        """
+        match = _RE_CONTRACT.search(url)
+        if not match:
+            return None, None, None
+        
+        token_id = match.group(2) if match.group(2) else None
+        return match.group(1), token_id, 'collection' if token_id else 'collectible'
+
     def extract_contract_and_id(self, url: str) -> Dict[str, Optional[str]]:
         """
         Extract contract address and token ID from NiftyGateway URL
@@ -144,19 +558,12 @@ class NiftyGatewayScraper:
         Returns:
             Dictionary containing contract and id (if available)
         """
-        contract_pattern = r'/marketplace/(?:collectible|collection)/([a-fA-F0-9x]+)(?:/(\d+))?'
-        match = re.search(contract_pattern, url)
-        
-        if match:
-            contract = match.group(1)
-            token_id = match.group(2) if match.group(2) else None
-            return {
-                'contract': contract,
-                'token_id': token_id,
-                'url_type': 'collection' if token_id else 'collectible'
-            }
-        
-        return {'contract': None, 'token_id': None, 'url_type': None}
+        contract, token_id, url_type = self._parse_contract(url)
+        return {
+            'contract': contract,
+            'token_id': token_id,
+            'url_type': url_type
+        }
     
     def extract_price(self, price_text: str) -> Optional[float]:
         """
@@ -168,11 +575,10 @@ class NiftyGatewayScraper:
         Returns:
             Float price or None if not found
         """
-        price_pattern = r'\$([0-9,]+\.?[0-9]*)'
-        match = re.search(price_pattern, price_text)
+        match = _RE_PRICE.search(price_text)
         
         if match:
-            price_str = match.group(1).replace(',', '')
+            price_str = match.group(1).translate(_STRIP_COMMAS)
             try:
                 return float(price_str)
             except ValueError:
@@ -180,160 +586,91 @@ class NiftyGatewayScraper:
         
         return None
     
-    def wait_for_items_to_load(self, timeout: int = 10) -> bool:
+    def scroll_to_load_more(self, scroll_pause_time: float = 5.0) -> bool:
         """
-        Wait for NFT items to load on the page
+        Scroll down to trigger loading of more items
         
-        Args:
-            timeout: Maximum time to wait in seconds
-            
-        Returns:
-            True if items loaded, False otherwise
-        """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='nft-card'], .marketplace-item, [href*='/marketplace/']"))
-            )
-            return True
-        except TimeoutException:
-            print("⚠️  Timeout waiting for items to load - continuing anyway")
-            return False
-        except Exception as e:
-            print(f"⚠️  Error waiting for items to load: {e} - continuing anyway")
-            return False
-    
-    def scroll_to_load_more(self, scroll_pause_time: float = 2.0) -> bool:
-        """
-        Scroll down to trigger loading of more items with multiple strategies
+        A MutationObserver in the page resolves as soon as new collection links
+        are added, so there is no fixed sleep after scrolling. If infinite scroll
+        does not fire, a "Load More" button is tried instead.
         
         Args:
-            scroll_pause_time: Time to wait after scrolling
+            scroll_pause_time: Maximum time to wait for new items after scrolling
             
         Returns:
             True if more content was loaded, False otherwise
         """
         try:
-            # Count current items before scrolling
-            initial_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-            items_before = len(initial_items)
+            result = self._trigger_and_wait_for_items(scroll_pause_time)
+            items_before = result['before']
             print(f"Items before scroll: {items_before}")
             
-            # Strategy 1: Multiple small scrolls to simulate user behavior
-            for scroll_step in range(5):
-                current_position = self.driver.execute_script("return window.pageYOffset")
-                scroll_amount = 800  # Smaller scroll amounts
-                self.driver.execute_script(f"window.scrollTo(0, {current_position + scroll_amount});")
-                time.sleep(0.5)  # Short pause between scrolls
-                
-                # Check for new items after each small scroll
-                current_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                if len(current_items) > items_before:
-                    print(f"Found {len(current_items) - items_before} new items after small scroll {scroll_step + 1}")
-                    return True
-            
-            # Strategy 2: Scroll to specific percentages of page
-            page_height = self.driver.execute_script("return document.body.scrollHeight")
-            for percentage in [0.25, 0.5, 0.75, 1.0]:
-                target_position = int(page_height * percentage)
-                self.driver.execute_script(f"window.scrollTo(0, {target_position});")
-                time.sleep(2)
-                
-                current_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                if len(current_items) > items_before:
-                    print(f"Found {len(current_items) - items_before} new items after scrolling to {percentage*100}%")
-                    return True
-            
-            # Strategy 3: Use keyboard navigation
-            try:
-                body = self.driver.find_element(By.TAG_NAME, "body")
-                for i in range(10):
-                    body.send_keys(Keys.PAGE_DOWN)
-                    time.sleep(0.3)
-                    
-                    current_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                    if len(current_items) > items_before:
-                        print(f"Found {len(current_items) - items_before} new items after PAGE_DOWN {i + 1}")
-                        return True
-            except Exception as e:
-                print(f"Keyboard navigation failed: {e}")
+            if result['loaded']:
+                print(f"Found {result['after'] - items_before} new items after scroll")
+                return True
             
-            # Strategy 4: Try to find and click a "Load More" button
+            # Try to find and click a "Load More" button: one CSS and one
+            # text XPath lookup (":contains()" is not valid CSS)
             try:
-                load_more_selectors = [
-                    "button[data-testid='load-more']",
-                    "button:contains('Load More')",
-                    "button:contains('Show More')",
-                    "[data-testid='load-more-button']",
-                    ".load-more",
-                    "button[class*='load']",
-                    "button[class*='more']"
-                ]
+                load_buttons = self.driver.find_elements(By.CSS_SELECTOR, LOAD_MORE_CSS)
+                load_buttons += self.driver.find_elements(By.XPATH, LOAD_MORE_XPATH)
                 
-                for selector in load_more_selectors:
+                for load_button in load_buttons:
                     try:
-                        if ":contains(" in selector:
-                            # Use XPath for text-based selection
-                            xpath_selector = f"//button[contains(text(), 'Load More') or contains(text(), 'Show More')]"
-                            load_button = self.driver.find_element(By.XPATH, xpath_selector)
-                        else:
-                            load_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        
                         if load_button.is_displayed() and load_button.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", load_button)
-                            time.sleep(3)
-                            
-                            current_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                            if len(current_items) > items_before:
-                                print(f"Found {len(current_items) - items_before} new items after clicking load more button")
+                            result = self._trigger_and_wait_for_items(scroll_pause_time, load_button)
+                            if result['loaded']:
+                                print(f"Found {result['after'] - items_before} new items after clicking load more button")
                                 return True
-                    except:
+                    except Exception:
                         continue
             except Exception as e:
                 print(f"Load more button search failed: {e}")
             
-            # Strategy 5: Aggressive scrolling with longer waits
-            print("Trying aggressive scrolling...")
-            for attempt in range(3):
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(5)  # Longer wait
-                
-                # Check for new content
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                current_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                
-                if len(current_items) > items_before:
-                    print(f"Found {len(current_items) - items_before} new items after aggressive scroll {attempt + 1}")
-                    return True
-                
-                # Try scrolling past the bottom
-                self.driver.execute_script(f"window.scrollTo(0, {new_height + 1000});")
-                time.sleep(3)
-                
-                final_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-                if len(final_items) > items_before:
-                    print(f"Found {len(final_items) - items_before} new items after over-scroll")
-                    return True
-            
-            # Final check
-            final_items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-            items_after = len(final_items)
-            
-            if items_after > items_before:
-                print(f"Scroll successful: {items_after - items_before} new items found")
-                return True
-            else:
-                print(f"No new content found after all strategies. Items: {items_before} -> {items_after}")
-                return False
+            print(f"No new content found after all strategies. Items: {items_before} -> {result['after']}")
+            return False
                 
         except Exception as e:
             print(f"Error during scrolling: {e}")
             return False
     
+    def _trigger_and_wait_for_items(self, timeout: float, click_element=None) -> Dict:
+        """
+        Scroll to the bottom (or click an element) and wait in the page for new collection links
+        
+        Args:
+            timeout: Maximum time to wait for new items in seconds
+            click_element: Optional element to click instead of scrolling
+            
+        Returns:
+            Dictionary with loaded flag and link counts before/after
+        """
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(SCROLL_AND_WAIT_JS, int(timeout * 1000), click_element)
+    
+    def _wait_for_more_links(self, before: int, timeout: float) -> int:
+        """
+        Wait until the page has more collection links than before
+        
+        Args:
+            before: Collection link count to exceed
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The new link count, or before on timeout
+        """
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(links_added(before))
+        except TimeoutException:
+            return before
+    
     def wait_for_items_to_load(self, timeout: int = 10) -> bool:
         """
         Wait for items to load on the page
         
+        Returns as soon as collection links are present and their count has
+        stopped changing between two polls.
+        
         Args:
             timeout: Maximum time to wait in seconds
             
@@ -343,22 +680,14 @@ class NiftyGatewayScraper:
         try:
             print("Waiting for items to load...")
             
-            # Wait for at least some items to appear
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
+            item_count = WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(items_stable())
+            print(f"Found {item_count} items after waiting")
             
-            # Wait for marketplace collection links to appear
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[href*='/marketplace/collection/']")))
-            
-            # Give extra time for all items to load
-            time.sleep(2)
-            
-            items = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-            print(f"Found {len(items)} items after waiting")
-            
-            return len(items) > 0
+            return True
             
+        except TimeoutException:
+            print("⚠️  Timeout waiting for items to load - continuing anyway")
+            return False
         except Exception as e:
             print(f"Error waiting for items: {e}")
             return False
@@ -374,21 +703,9 @@ class NiftyGatewayScraper:
             # Wait for items to load first
             self.wait_for_items_to_load()
             
-            # Get all collection links
-            collection_links = self.driver.find_elements(By.CSS_SELECTOR, "[href*='/marketplace/collection/']")
-            
-            urls = []
-            for link in collection_links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and '/marketplace/collection/' in href:
-                        # Normalize URL (remove query params, fragments)
-                        base_url = href.split('?')[0].split('#')[0]
-                        if base_url not in urls:
-                            urls.append(base_url)
-                except Exception as e:
-                    print(f"Error getting href from link: {e}")
-                    continue
+            # Read every normalized href in one round-trip instead of one get_attribute per link
+            hrefs = self.driver.execute_script(COLLECTION_HREFS_JS)
+            urls = list(dict.fromkeys(hrefs))
             
             print(f"Found {len(urls)} unique collection URLs")
             return urls
@@ -422,216 +739,342 @@ class NiftyGatewayScraper:
                 print(f"⚠️  Table data extraction failed: {e}")
                 table_data = None
             
-            # If no table data found (no listing available), skip this item
-            if not table_data:
-                print(f"⚠️  No listing data found for {item_url}, skipping item")
-                return None
+            return self._build_item_data(item_url, contract_info, table_data)
             
-            floor_price = None
-            floor_price_text = ""
-            actual_token_id = table_data.get('token_id')
-            list_price_str = table_data.get('list_price')
+        except Exception as e:
+            print(f"⚠️  Data extraction error: {e}")
+            return None
+
+    def _build_item_data(self, item_url: str, contract_info: Dict[str, Optional[str]], table_data: Optional[Dict[str, str]]) -> Optional[Dict]:
+        """
+        Build the item dictionary from the cheapest listing of a collection page
+        
+        Args:
+            item_url: The collection URL the table data came from
+            contract_info: Parsed contract info for item_url
+            table_data: Dictionary with token_id and list_price
             
-            # If no list price found, skip this item
-            if not list_price_str:
-                print(f"⚠️  No list price found for {item_url}, skipping item")
-                return None
+        Returns:
+            Dictionary containing item data or None if there is no usable listing
+        """
+        # If no table data found (no listing available), skip this item
+        if not table_data:
+            print(f"⚠️  No listing data found for {item_url}, skipping item")
+            return None
+        
+        floor_price = None
+        floor_price_text = ""
+        actual_token_id = table_data.get('token_id')
+        list_price_str = table_data.get('list_price')
+        
+        # If no list price found, skip this item
+        if not list_price_str:
+            print(f"⚠️  No list price found for {item_url}, skipping item")
+            return None
+        
+        try:
+            floor_price = float(list_price_str)
+            floor_price_text = f"${list_price_str} (Table List Price)"
+        except (ValueError, TypeError) as e:
+            print(f"⚠️  Price conversion failed: {e}")
+            return None
+        
+        return {
+            'floor_price': floor_price,
+            'floor_price_text': floor_price_text,
+            'contract': contract_info['contract'],
+            'actual_token_id': actual_token_id,
+            'url_type': contract_info['url_type'],
+            'marketplace_url': item_url,
+            'actual_marketplace_url': None,
+            'scraped_at': datetime.now().isoformat()
+        }
+
+    def _copy_browser_cookies(self):
+        """Copy the browser's cookies into the HTTP session so plain fetches look like the same visitor"""
+        try:
+            for cookie in self.driver.get_cookies():
+                self.http_session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain'), path=cookie.get('path', '/')
+                )
+        except Exception as e:
+            print(f"⚠️  Could not copy browser cookies: {e}")
+
+    def fetch_collection_html(self, url: str) -> Optional[str]:
+        """
+        Fetch a collection page over plain HTTP, without rendering it in the browser
+        
+        Args:
+            url: Collection page URL
             
-            try:
-                floor_price = float(list_price_str)
-                floor_price_text = f"${list_price_str} (Table List Price)"
-            except (ValueError, TypeError) as e:
-                print(f"⚠️  Price conversion failed: {e}")
-                return None
+        Returns:
+            Page HTML or None if the request failed
+        """
+        try:
+            response = self.http_session.get(url, timeout=10)
+            if response.status_code == 200:
+                return response.text
+            print(f"⚠️  HTTP fetch returned {response.status_code} for {url}")
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  HTTP fetch failed for {url}: {e}")
+        return None
+
+    def _prefetch_collection_html(self, urls: List[str]):
+        """
+        Fetch collection pages over HTTP a few URLs ahead of the consumer
+        
+        Keeps up to HTTP_PREFETCH_WINDOW requests in flight on the pooled
+        session, so network latency overlaps with parsing and browser
+        fallbacks. No new fetches start once the fast path is switched off.
+        
+        Args:
+            urls: Collection URLs to fetch
             
-            return {
-                'floor_price': floor_price,
-                'floor_price_text': floor_price_text,
-                'contract': contract_info['contract'],
-                'actual_token_id': actual_token_id,
-                'marketplace_url': item_url,
-                'actual_marketplace_url': None,
-                'scraped_at': datetime.now().isoformat()
-            }
+        Yields:
+            (collection_url, page_html) tuples in input order, page_html is None if not fetched
+        """
+        url_iter = iter(urls)
+        if self.http_fast_path:
+            with ThreadPoolExecutor(max_workers=HTTP_PREFETCH_WINDOW) as executor:
+                pending = deque()
+                while True:
+                    while self.http_fast_path and len(pending) < HTTP_PREFETCH_WINDOW:
+                        url = next(url_iter, None)
+                        if url is None:
+                            break
+                        pending.append((url, executor.submit(self.fetch_collection_html, url)))
+                    if not pending:
+                        break
+                    url, future = pending.popleft()
+                    yield url, future.result()
+        
+        for url in url_iter:
+            yield url, None
+
+    def extract_item_data_from_html(self, item_url: str, page_html: Optional[str] = None) -> Optional[Dict]:
+        """
+        Extract item data from a collection page fetched over plain HTTP
+        
+        Pages that come back as a JS-only shell (no marketplace table in the
+        markup) return None so the caller can fall back to Selenium. After a
+        few consecutive shells the fast path is switched off for this run.
+        
+        Args:
+            item_url: Collection URL to fetch
+            page_html: Already fetched page HTML (fetched here if None)
             
+        Returns:
+            Dictionary containing item data, or None if there is no usable
+            listing or the browser is needed
+        """
+        return self._item_data_from_html(item_url, page_html)[1]
+    
+    def _item_data_from_html(self, item_url: str, page_html: Optional[str] = None) -> Tuple[bool, Optional[Dict]]:
+        """
+        Extract item data over plain HTTP, telling "no listing" apart from "needs the browser"
+        
+        Args:
+            item_url: Collection URL to fetch
+            page_html: Already fetched page HTML (fetched here if None)
+            
+        Returns:
+            (handled, item_data) tuple: handled is True when the server-rendered
+            table was parsed, even if it had no usable listing (item_data None);
+            False means the page must be loaded in the browser
+        """
+        if not self.http_fast_path:
+            return False, None
+        
+        if page_html is None:
+            page_html = self.fetch_collection_html(item_url)
+        if not page_html:
+            return False, None
+        
+        try:
+            table_data = self.get_cheapest_token_id_and_price_from_html(page_html)
         except Exception as e:
-            print(f"⚠️  Data extraction error: {e}")
+            print(f"⚠️  HTML table parsing failed: {e}")
+            table_data = None
+        
+        if table_data is None:
+            self.http_shell_pages += 1
+            if self.http_shell_pages >= 3:
+                print("ℹ️  Collection pages are rendered client-side - disabling HTTP fast path")
+                self.http_fast_path = False
+            return False, None
+        
+        self.http_shell_pages = 0
+        return True, self._build_item_data(item_url, self.extract_contract_and_id(item_url), table_data)
+
+    def get_cheapest_token_id_and_price_from_html(self, page_html: str) -> Optional[Dict[str, str]]:
+        """
+        Find the token ID and list price of the cheapest item in collection page HTML
+        
+        Args:
+            page_html: Raw HTML of a collection page
+            
+        Returns:
+            Dictionary with token_id and list_price or None if the table is not in the markup
+        """
+        tree = lxml_html.fromstring(page_html)
+        rows = tree.xpath("//table//tbody/tr")
+        if not rows:
+            return None
+        
+        # The first row should be the cheapest (sorted by price)
+        cheapest_row = rows[0]
+        
+        token_id = None
+        for href in cheapest_row.xpath(".//a[contains(@href, '/marketplace/item/')]/@href"):
+            token_match = _RE_ITEM_TOK.search(href)
+            if token_match:
+                token_id = token_match.group(1)
+                break
+        
+        if not token_id:
+            token_match = _RE_HASH_TOK.search(cheapest_row.text_content())
+            if token_match:
+                token_id = token_match.group(1)
+        
+        if not token_id:
             return None
+        
+        headers = [header.text_content() for header in cheapest_row.xpath("ancestor::table[1]//th")]
+        cells = [cell.text_content() for cell in cheapest_row.xpath("./td")]
+        list_price = self._parse_list_price(self._build_column_index(headers), cells, token_id)
+        
+        return {'token_id': token_id, 'list_price': list_price}
+
+    def _build_column_index(self, headers: List[str]) -> Dict[str, int]:
+        """
+        Map lowercased table header text to its column index
+        
+        Args:
+            headers: Table header texts in column order
+            
+        Returns:
+            Dictionary of header text to the first column index it appears at
+        """
+        column_index = {}
+        for i, header in enumerate(headers):
+            column_index.setdefault(header.strip().lower(), i)
+        return column_index
+
+    def _parse_list_price(self, column_index: Dict[str, int], cells: List[str], token_id: Optional[str]) -> Optional[str]:
+        """
+        Pick the List Price out of a table row's cell texts
+        
+        Args:
+            column_index: Header text -> column index map of the table
+            cells: Cell texts of the row
+            token_id: Token ID of the row (for log messages)
+            
+        Returns:
+            List price string without thousands separators, or None if the item is not listed
+        """
+        cells = [cell.strip() for cell in cells]
+        
+        # Method 1: Find the List Price column from the header structure
+        list_price_column_index = None
+        for header, i in column_index.items():
+            if "list price" in header:
+                list_price_column_index = i
+                break
+        
+        if list_price_column_index is not None and list_price_column_index < len(cells):
+            list_price_text = cells[list_price_column_index]
+            if list_price_text in _NO_LISTING:
+                print(f"No listing found for token {token_id} (List Price shows: '{list_price_text}'), skipping item")
+                return None
+            
+            price_match = _RE_PRICE.search(list_price_text)
+            if price_match:
+                return price_match.group(1).translate(_STRIP_COMMAS)
+        
+        # Method 2: The rightmost price column (Last Sale, then List Price)
+        for i in range(max(len(cells) - 2, 0), len(cells)):
+            cell_text = cells[i]
+            if cell_text in _NO_LISTING:
+                continue
+            
+            price_match = _RE_PRICE.search(cell_text)
+            if price_match:
+                if i + 1 < len(cells) and cells[i + 1] in _NO_LISTING:
+                    print(f"Found Last Sale price but List Price shows '{cells[i + 1]}' (no listing), skipping item")
+                    return None
+                return price_match.group(1).translate(_STRIP_COMMAS)
+        
+        print(f"Could not find valid List Price for token {token_id}, skipping item")
+        return None
+
+    def _wait_for_listing_table(self, timeout: int = 10) -> bool:
+        """
+        Wait until the collection page shows a listing row or item link
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the listing table appeared, False on timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_ROW_SELECTOR))
+            )
+            return True
+        except TimeoutException:
+            print("⚠️  Timeout waiting for listing table - continuing anyway")
+            return False
 
     def get_cheapest_token_id_and_price_from_current_page(self) -> Optional[Dict[str, str]]:
         """
         Find the token ID and list price of the cheapest item from the current collection page
         
+        The cheapest row is read with a single execute_script call; token and
+        price parsing then happens in Python on the returned strings.
+        
         Returns:
             Dictionary with token_id and list_price or None if not found
         """
         try:
-            # Wait for the marketplace items table to load
-            time.sleep(1)  # Reduced from 3 to 1 second
-            
-            # Look for the marketplace items table - try different approaches
-            table_selectors = [
-                "table tbody tr",
-                ".MuiTableBody-root tr",
-                "[class*='MuiTableBody'] tr",
-                "tbody tr"
-            ]
-            
-            cheapest_item = None
-            for selector in table_selectors:
-                try:
-                    items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if items:
-                        # The first item should be the cheapest (sorted by price)
-                        cheapest_item = items[0]
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not cheapest_item:
-                # Try finding links directly
-                link_selectors = [
-                    "a[href*='/marketplace/item/']",
-                    "[href*='/marketplace/item/']"
-                ]
-                
-                for selector in link_selectors:
-                    try:
-                        links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if links:
-                            # First link should be cheapest
-                            item_url = links[0].get_attribute('href')
-                            if item_url and '/marketplace/item/' in item_url:
-                                token_match = re.search(r'/marketplace/item/[^/]+/(\d+)/', item_url)
-                                if token_match:
-                                    token_id = token_match.group(1)
-                                    return {'token_id': token_id, 'list_price': None}
-                            break
-                    except NoSuchElementException:
-                        continue
-                        
+            # Wait for the cheapest row's price to render, not a fixed pause
+            try:
+                row = WebDriverWait(self.driver, 3, poll_frequency=0.1).until(cheapest_row_rendered)
+            except TimeoutException:
+                row = self.driver.execute_script(CHEAPEST_ROW_JS)
+            if not row:
                 return None
             
-            # Found a table row, extract both token ID and list price
+            # Get token ID from the item link, e.g. /marketplace/item/0x123.../8666/
             token_id = None
-            list_price = None
+            href = row.get('href') or ''
+            if '/marketplace/item/' in href:
+                token_match = _RE_ITEM_TOK.search(href)
+                if token_match:
+                    token_id = token_match.group(1)
             
-            # Get token ID from link
-            try:
-                # Look for link with marketplace/item pattern inside the row
-                link = cheapest_item.find_element(By.CSS_SELECTOR, "a[href*='/marketplace/item/']")
-                item_url = link.get_attribute('href')
-                
-                if item_url and '/marketplace/item/' in item_url:
-                    # Extract token ID from URL like: /marketplace/item/0x123.../8666/
-                    token_match = re.search(r'/marketplace/item/[^/]+/(\d+)/', item_url)
-                    if token_match:
-                        token_id = token_match.group(1)
-                
-            except NoSuchElementException:
-                pass
+            if not row.get('row'):
+                # No table row, only a bare item link (first link should be cheapest)
+                return {'token_id': token_id, 'list_price': None} if token_id else None
             
-            # Alternative: look for the token ID in the text content (like "#8666 / 15045")
+            # Alternative: look for "#8666 / 15045", "#8666/15045" or "#8666" in the row text
             if not token_id:
-                try:
-                    item_text = cheapest_item.text
-                    
-                    # Look for patterns like "#8666 / 15045" or "#8666/15045"
-                    token_patterns = [
-                        r'#(\d+)\s*/\s*\d+',  # "#8666 / 15045"
-                        r'#(\d+)/\d+',        # "#8666/15045"
-                        r'#(\d+)',            # "#8666"
-                    ]
-                    
-                    for pattern in token_patterns:
-                        match = re.search(pattern, item_text)
-                        if match:
-                            token_id = match.group(1)
-                            break
-                            
-                except Exception as e:
-                    pass
+                match = _RE_HASH_TOK.search(row.get('text') or '')
+                if match:
+                    token_id = match.group(1)
+            
+            if not token_id:
+                return None
             
             # Extract list price from the table row - ONLY from List Price column
-            try:
-                # Get all table cells in this row
-                cells = cheapest_item.find_elements(By.CSS_SELECTOR, "td, .MuiTableCell-root, [class*='MuiTableCell']")
-                
-                # Look for the List Price column specifically
-                list_price = None
-                list_price_found = False
-                
-                # Method 1: Try to find List Price column by looking at header structure
-                try:
-                    # Get the table header to understand column structure
-                    table = cheapest_item.find_element(By.XPATH, "./ancestor::table")
-                    headers = table.find_elements(By.CSS_SELECTOR, "th, .MuiTableHead-root th, [class*='MuiTableHead'] th")
-                    
-                    list_price_column_index = None
-                    for i, header in enumerate(headers):
-                        if "list price" in header.text.lower():
-                            list_price_column_index = i
-                            break
-                    
-                    if list_price_column_index is not None and list_price_column_index < len(cells):
-                        list_price_cell = cells[list_price_column_index]
-                        list_price_text = list_price_cell.text.strip()
-                        
-                        # Check if the List Price column shows "--" or empty (no listing)
-                        if list_price_text in ['--', '-', '', 'N/A', 'n/a']:
-                            print(f"No listing found for token {token_id} (List Price shows: '{list_price_text}'), skipping item")
-                            return None  # Skip this item - no listing available
-                        
-                        # Extract price only from List Price column
-                        price_match = re.search(r'\$([0-9,]+\.?[0-9]*)', list_price_text)
-                        if price_match:
-                            list_price = price_match.group(1).replace(',', '')
-                            list_price_found = True
-                            
-                except Exception:
-                    pass
-                
-                # Method 2: If we couldn't find by header, try to identify List Price column by position
-                # Look for the rightmost column that contains prices (usually List Price)
-                if not list_price_found:
-                    # Check each cell for the List Price pattern
-                    for i, cell in enumerate(cells):
-                        cell_text = cell.text.strip()
-                        
-                        # Check if this cell shows "--" (no listing)
-                        if cell_text in ['--', '-', '', 'N/A', 'n/a'] and i >= len(cells) - 2:  # Last 2 columns are typically Last Sale and List Price
-                            # This might be the List Price column showing no listing
-                            continue
-                        
-                        # If this cell contains a price and is in the rightmost columns
-                        if re.search(r'\$([0-9,]+\.?[0-9]*)', cell_text) and i >= len(cells) - 2:
-                            # Check if the next column (if exists) shows "--" which would indicate this is Last Sale, not List Price
-                            if i + 1 < len(cells):
-                                next_cell_text = cells[i + 1].text.strip()
-                                if next_cell_text in ['--', '-', '', 'N/A', 'n/a']:
-                                    print(f"Found Last Sale price but List Price shows '{next_cell_text}' (no listing), skipping item")
-                                    return None  # No listing available
-                            
-                            # This appears to be a valid list price
-                            price_match = re.search(r'\$([0-9,]+\.?[0-9]*)', cell_text)
-                            if price_match:
-                                list_price = price_match.group(1).replace(',', '')
-                                list_price_found = True
-                                break
-                
-                # If we still haven't found a confirmed List Price, skip this item
-                # We don't want to accidentally pick up Last Sale prices
-                if not list_price_found:
-                    print(f"Could not find valid List Price for token {token_id}, skipping item")
-                    return None
-                    
-            except Exception as e:
-                pass
-            
-            if token_id:
-                return {'token_id': token_id, 'list_price': list_price}
+            # (headers come back in the same script call as the row)
+            column_index = self._build_column_index(row.get('headers') or [])
+            list_price = self._parse_list_price(column_index, row.get('cells') or [], token_id)
+            if list_price is None:
+                return None
             
-            return None
+            return {'token_id': token_id, 'list_price': list_price}
             
         except Exception as e:
             return None
@@ -651,7 +1094,7 @@ class NiftyGatewayScraper:
             self.driver.get(collection_url)
             
             # Wait for the marketplace items table to load
-            time.sleep(3)
+            self._wait_for_listing_table()
             
             # Look for the marketplace items table
             table_selectors = [
@@ -662,62 +1105,32 @@ class NiftyGatewayScraper:
                 "a[href*='/marketplace/item/']"
             ]
             
-            cheapest_item = None
-            for selector in table_selectors:
-                try:
-                    items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if items:
-                        print(f"Found {len(items)} items in table with selector: {selector}")
-                        # The first item should be the cheapest (sorted by price)
-                        cheapest_item = items[0]
-                        break
-                except NoSuchElementException:
-                    continue
-            
+            # Selector match, item link and text of the first item in one round-trip
+            cheapest_item = self.driver.execute_script(FIRST_MARKET_ITEM_JS, table_selectors)
             if not cheapest_item:
                 print("No items found in marketplace table")
                 return None
+            print(f"Found {cheapest_item['count']} items in table with selector: {cheapest_item['selector']}")
             
-            # Try to get the item URL directly
-            item_url = cheapest_item.get_attribute('href')
-            if not item_url:
-                # If the row doesn't have href, look for a link inside it
-                try:
-                    link = cheapest_item.find_element(By.CSS_SELECTOR, "a[href*='/marketplace/item/']")
-                    item_url = link.get_attribute('href')
-                except NoSuchElementException:
-                    pass
-            
+            item_url = cheapest_item['href']
             if item_url and '/marketplace/item/' in item_url:
                 # Extract token ID from URL like: /marketplace/item/0x123.../28/
-                import re
-                token_match = re.search(r'/marketplace/item/[^/]+/(\d+)/', item_url)
+                token_match = _RE_ITEM_TOK.search(item_url)
                 if token_match:
                     token_id = token_match.group(1)
                     print(f"Found cheapest token ID: {token_id}")
                     return token_id
             
             # Alternative approach: look for token ID in the text content
-            try:
-                item_text = cheapest_item.text
-                print(f"Item text: {item_text}")
-                
-                # Look for patterns like "#28" or "28 /" in the text
-                token_patterns = [
-                    r'#(\d+)',
-                    r'^(\d+)\s*/',
-                    r'(\d+)\s*/\s*\d+'
-                ]
-                
-                for pattern in token_patterns:
-                    match = re.search(pattern, item_text)
-                    if match:
-                        token_id = match.group(1)
-                        print(f"Found token ID from text: {token_id}")
-                        return token_id
-                        
-            except Exception as e:
-                print(f"Error extracting token ID from text: {e}")
+            item_text = cheapest_item['text']
+            print(f"Item text: {item_text}")
+            
+            # Look for patterns like "#28" or "28 /" in the text
+            match = _RE_HASH_TOK.search(item_text) or _RE_SLASH_TOK.search(item_text)
+            if match:
+                token_id = match.group(match.lastindex)
+                print(f"Found token ID from text: {token_id}")
+                return token_id
             
             print("Could not extract token ID from cheapest item")
             return None
@@ -737,51 +1150,75 @@ class NiftyGatewayScraper:
             Dictionary containing item data or None if extraction failed
         """
         try:
-            # Get the URL (item_element should be a link)
-            item_url = item_element.get_attribute('href')
+            # Read href, heading and container text in one round-trip
+            card = self.driver.execute_script(CARD_FIELDS_JS, item_element)
+            
+            # The URL (item_element should be a link)
+            item_url = card.get('href')
             if not item_url or '/marketplace/' not in item_url:
                 return None
             
             # Get contract info
             contract_info = self.extract_contract_and_id(item_url)
             
-            # Find parent container for text extraction
-            extraction_element = item_element
-            try:
-                extraction_element = item_element.find_element(By.XPATH, "..")
-            except:
-                pass
-            
-            # Get all text from the container
-            all_text = extraction_element.text
+            # All text from the parent container
+            all_text = card.get('text')
             if not all_text:
                 return None
             
-            # Fast text-based extraction
-            lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-            
-            # Extract title (usually first line)
-            title = lines[0] if lines else "Unknown"
-            
-            # Extract creator (look for "Creator:" pattern)
-            creator = "Unknown"
-            for i, line in enumerate(lines):
-                if line.lower() == "creator:" and i + 1 < len(lines):
-                    creator = lines[i + 1]
+            # Fast text-based extraction: one pass over the lines for title
+            # (first line, unless the card has a heading) and creator
+            title = card.get('title')
+            creator = None
+            creator_on_next_line = False
+            for raw_line in all_text.split('\n'):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                
+                if not title:
+                    title = line
+                
+                if creator_on_next_line:
+                    creator = line
+                elif creator is None:
+                    # Look for "Creator:" pattern (case-insensitive, no lowercased copy)
+                    creator_match = _RE_CREATOR.search(line)
+                    if creator_match:
+                        if creator_match.end() - creator_match.start() == len(line):
+                            creator_on_next_line = True
+                        else:
+                            creator = line.replace("Creator:", "").strip()
+                
+                if title and creator:
                     break
-                elif "creator:" in line.lower() and line.strip() != "Creator:":
-                    creator = line.replace("Creator:", "").strip()
+            
+            title = title or "Unknown"
+            creator = creator or "Unknown"
+            
+            # Scan the text once for the first price, the first item count
+            # and any "floor" label
+            price_str = None
+            count_str = None
+            has_floor = False
+            for match in _RE_CARD_TOKENS.finditer(all_text):
+                kind = match.lastgroup
+                if kind == 'price':
+                    if price_str is None:
+                        price_str = match.group('price')
+                elif kind == 'items':
+                    if count_str is None:
+                        count_str = match.group('items')
+                else:
+                    has_floor = True
+                if price_str is not None and count_str is not None and has_floor:
                     break
             
-            # Extract floor price using regex
+            # Extract floor price
             floor_price = None
             floor_price_text = ""
-            import re
-            
-            # Look for price pattern in text
-            price_match = re.search(r'\$([0-9,]+\.?[0-9]*)', all_text)
-            if price_match and "floor" in all_text.lower():
-                price_str = price_match.group(1).replace(',', '')
+            if price_str is not None and has_floor:
+                price_str = price_str.translate(_STRIP_COMMAS)
                 try:
                     floor_price = float(price_str)
                     floor_price_text = f"${price_str} Floor Price"
@@ -790,10 +1227,9 @@ class NiftyGatewayScraper:
             
             # Extract item count
             item_count = None
-            count_match = re.search(r'(\d+)\s*[Ii]tems', all_text)
-            if count_match:
+            if count_str is not None:
                 try:
-                    item_count = int(count_match.group(1))
+                    item_count = int(count_str)
                 except ValueError:
                     pass
             
@@ -816,6 +1252,283 @@ class NiftyGatewayScraper:
             print(f"Error extracting item data: {str(e)}")
             return None
     
+    def process_collection_url(self, collection_url: str, page_html: Optional[str] = None) -> Optional[Dict]:
+        """
+        Load a single collection page and extract its cheapest listing
+        
+        Tries plain HTTP first and falls back to navigating the browser,
+        with retry and crash recovery. Safe to call from pool workers.
+        
+        Args:
+            collection_url: URL of the collection page
+            page_html: Prefetched page HTML, if any
+            
+        Returns:
+            Dictionary containing item data or None if extraction failed
+        """
+        try:
+            # Plain HTTP first - no browser navigation when the table is server-rendered,
+            # including when it shows the collection has no listing
+            handled, item_data = self._item_data_from_html(collection_url, page_html)
+            if handled:
+                return item_data
+            
+            if not self.driver:
+                self.setup_driver()
+                if not self.driver:
+                    return None
+            
+            # Navigate to collection page with retry and crash recovery
+            navigation_success = False
+            for retry in range(3):  # Try 3 times instead of 2
+                if self._closed:
+                    break
+                try:
+                    self.driver.get(collection_url)
+                    self._wait_for_listing_table()
+                    navigation_success = True
+                    break
+                except Exception as nav_error:
+                    error_msg = str(nav_error)
+                    print(f"⚠️  Navigation attempt {retry + 1} failed: {nav_error}")
+                    
+                    # Check for Chrome crash and restart driver
+                    if "tab crashed" in error_msg.lower() or "session deleted" in error_msg.lower():
+                        print("🔄 Chrome crashed - restarting WebDriver...")
+                        try:
+                            if self.driver:
+                                self.driver.quit()
+                        except:
+                            pass
+                        self.setup_driver()
+                        if not self.driver:
+                            print("❌ Failed to restart WebDriver")
+                            break
+                            
+                    if retry < 2:  # Don't wait on final attempt
+                        time.sleep(3)  # Longer wait before retry
+            
+            if not navigation_success:
+                print(f"❌ Failed to navigate to {collection_url} after retries")
+                return None
+            
+            return self.extract_item_data_from_page(collection_url)
+            
+        except Exception as e:
+            print(f"⚠️  Data extraction failed for {collection_url}: {e}")
+            return None
+
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the result cache on first use
+        
+        WAL mode and a busy timeout let several scrapers (e.g. BrowserPool
+        threads) share one cache file without "database is locked" errors.
+        
+        Returns:
+            The cache connection, or None if caching is off or the file can't be opened
+        """
+        if self._cache is None and self.cache_path:
+            try:
+                cache = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+                cache.execute("PRAGMA journal_mode=WAL")
+                cache.execute("CREATE TABLE IF NOT EXISTS items (url TEXT PRIMARY KEY, payload TEXT, ts REAL)")
+                cache.commit()
+                self._cache = cache
+            except sqlite3.Error as e:
+                print(f"⚠️  Could not open cache {self.cache_path}: {e} - caching disabled")
+                self.cache_path = None
+        return self._cache
+    
+    def _cache_get(self, collection_url: str) -> Optional[Dict]:
+        """
+        Look up a cached collection page result
+        
+        Args:
+            collection_url: URL of the collection page
+            
+        Returns:
+            Cached item data marked with cached=True and the original read time
+            in cached_at, or None if missing or older than cache_ttl
+        """
+        try:
+            row = self._cache.execute("SELECT payload, ts FROM items WHERE url = ?", (collection_url,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️  Cache lookup failed: {e}")
+            return None
+        if row is None or time.time() - row[1] >= self.cache_ttl:
+            return None
+        item_data = json.loads(row[0])
+        item_data['cached'] = True
+        item_data['cached_at'] = item_data.get('scraped_at')
+        item_data['scraped_at'] = datetime.now().isoformat()
+        return item_data
+    
+    def _store_in_cache(self, results):
+        """
+        Write complete collection page results through to the cache as they arrive
+        
+        Args:
+            results: Iterable of (collection_url, item_data) tuples
+            
+        Yields:
+            The same tuples, unchanged
+        """
+        for collection_url, item_data in results:
+            if (self._cache is not None and item_data
+                    and item_data.get('floor_price') is not None and item_data.get('actual_token_id')):
+                try:
+                    self._cache.execute(
+                        "INSERT OR REPLACE INTO items (url, payload, ts) VALUES (?, ?, ?)",
+                        (collection_url, json.dumps(item_data, ensure_ascii=False), time.time())
+                    )
+                    self._cache.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    print(f"⚠️  Cache write failed: {e}")
+            yield collection_url, item_data
+    
+    def _enrich_item(self, item_data: Dict) -> Dict:
+        """
+        Add OpenSea collection info and arbitrage data to a scraped item
+        
+        Fires the arbitrage callback for opportunities as soon as they are found.
+        
+        Args:
+            item_data: Complete item data with contract and actual_token_id
+            
+        Returns:
+            The enriched item dictionary
+        """
+        # Enrich with OpenSea collection data if enabled
+        if self.enable_opensea_enrichment and self.opensea_client:
+            try:
+                if self.verbose:
+                    print(f"🔗 Enriching item with OpenSea data...")
+                item_data = self.opensea_client.enrich_item_with_collection_info(item_data)
+            except Exception as opensea_error:
+                print(f"⚠️  OpenSea enrichment failed: {opensea_error}")
+                # Continue without enrichment
+        
+        # Analyze arbitrage opportunities if enabled and we have collection data
+        if (self.enable_arbitrage_analysis and self.offers_client and 
+            'collection_slug' in item_data and item_data.get('collection_slug') not in ['unknown', 'not-found']):
+            try:
+                if self.verbose:
+                    print(f"💎 Analyzing arbitrage opportunity...")
+                item_data = self.offers_client.enrich_item_with_arbitrage_data(item_data)
+                
+                # Fire real-time callback for arbitrage opportunities, but not for
+                # listings served from the cache: their price may be cache_ttl old
+                if item_data.get('cached'):
+                    if self.verbose:
+                        print(f"ℹ️  Cached listing (read {item_data.get('cached_at')}) - no real-time alert")
+                elif (self.arbitrage_callback and 
+                    item_data.get('arbitrage_flag') and 
+                    item_data.get('arbitrage_flag') != "⚫ NO_OFFER"):
+                    try:
+                        self.arbitrage_callback(item_data)
+                        print(f"🔥 Real-time arbitrage alert sent: {item_data.get('arbitrage_flag')}")
+                    except Exception as callback_error:
+                        print(f"⚠️  Callback failed: {callback_error}")
+                        
+            except Exception as arbitrage_error:
+                print(f"⚠️  Arbitrage analysis failed: {arbitrage_error}")
+                # Continue without arbitrage data
+        
+        return item_data
+    
+    def _enrich_ahead(self, results):
+        """
+        Enrich complete listings on a background thread while later collection pages load
+        
+        A single enrichment thread keeps the OpenSea clients' rate limiting and
+        alert order intact; results are yielded in their original order.
+        
+        Args:
+            results: Iterable of (collection_url, item_data) tuples
+            
+        Yields:
+            (collection_url, item_data) tuples, enriched where applicable
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrich") as executor:
+            window = deque()
+            for collection_url, item_data in results:
+                future = None
+                if (item_data and item_data.get('floor_price') is not None
+                        and item_data.get('url_type') == 'collection' and item_data.get('actual_token_id')):
+                    # Build the actual marketplace URL for the cheapest item
+                    item_data['actual_marketplace_url'] = f"https://www.niftygateway.com/marketplace/item/{item_data['contract']}/{item_data['actual_token_id']}/"
+                    future = executor.submit(self._enrich_item, item_data)
+                window.append((collection_url, item_data, future))
+                
+                # Hand back finished items in order, holding at most ENRICH_AHEAD_WINDOW
+                while window and (window[0][2] is None or window[0][2].done() or len(window) > ENRICH_AHEAD_WINDOW):
+                    yield self._enriched_result(window.popleft())
+            
+            while window:
+                yield self._enriched_result(window.popleft())
+    
+    @staticmethod
+    def _enriched_result(entry: Tuple) -> Tuple[str, Optional[Dict]]:
+        """
+        Resolve one _enrich_ahead window entry
+        
+        Args:
+            entry: (collection_url, item_data, future) tuple; future is None
+                for results that were not sent for enrichment
+            
+        Returns:
+            (collection_url, item_data) tuple, with the enriched item when available
+        """
+        collection_url, item_data, future = entry
+        if future is not None:
+            try:
+                item_data = future.result()
+            except Exception as enrich_error:
+                print(f"⚠️  Enrichment failed: {enrich_error}")
+        return collection_url, item_data
+    
+    def _process_collection_urls_in_pool(self, urls: List[str]):
+        """
+        Fan collection URLs out to worker processes, each owning its own browser
+        
+        Args:
+            urls: Collection URLs to process
+            
+        Yields:
+            (collection_url, item_data) tuples in completion order
+        """
+        # The pool (and each worker's browser) is kept across scrape_items() calls
+        # and shut down in close()
+        if self._pool is None:
+            # Workers carry over the session cookies copied from the browser so
+            # their HTTP fast path sees the same pages this process does
+            cookies = [(c.name, c.value, c.domain, c.path) for c in self.http_session.cookies]
+            # Spawn rather than fork: the prefetch, enrichment and BrowserPool threads
+            # may already be running, and forking while they hold locks can deadlock
+            self._pool = multiprocessing.get_context('spawn').Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.headless, self.http_fast_path, self.verbose, cookies)
+            )
+        # Keep chunks small enough that short URL lists still spread across every worker
+        chunksize = max(1, min(4, len(urls) // (self.workers * 4)))
+        try:
+            for result in self._pool.imap_unordered(scrape_one, urls, chunksize=chunksize):
+                yield result
+        except BaseException:
+            # Abandoned mid-run (error, Ctrl-C or generator closed): workers may
+            # still be busy with the rest of the URLs, so don't reuse them
+            self._terminate_pool()
+            raise
+    
+    def _terminate_pool(self):
+        """Kill the worker processes without waiting for queued URLs"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
     def scrape_items(self, url: str, max_items: int = 100, max_scrolls: int = 20) -> List[Dict]:
         """
         Scrape NFT items from NiftyGateway using two-phase approach:
@@ -855,7 +1568,7 @@ class NiftyGatewayScraper:
             print("\n🔍 Phase 1: Collecting ALL collection URLs with aggressive scrolling...")
             
             try:
-                all_collection_urls = self.collect_all_urls_with_scrolling(max_scrolls)
+                all_collection_urls = self.collect_all_urls_with_scrolling(max_scrolls, target=max_items)
             except Exception as e:
                 print(f"⚠️  Error during URL collection: {e}")
                 print("🔄 Attempting basic URL collection as fallback...")
@@ -878,54 +1591,43 @@ class NiftyGatewayScraper:
             
             print(f"\n⚙️ Phase 2: Processing {len(all_collection_urls)} collection URLs...")
             
+            if self.http_fast_path:
+                self._copy_browser_cookies()
+            
             # Process each URL to get floor price data
             scraped_count = 0
             failed_count = 0
             
-            for i, collection_url in enumerate(all_collection_urls, 1):
+            # Fresh cached results skip loading their collection page entirely
+            cached_results = []
+            pending_urls = all_collection_urls
+            if self._open_cache() is not None:
+                pending_urls = []
+                for collection_url in all_collection_urls:
+                    cached = self._cache_get(collection_url)
+                    if cached:
+                        cached_results.append((collection_url, cached))
+                    else:
+                        pending_urls.append(collection_url)
+                print(f"💾 {len(cached_results)} collection pages served from cache")
+            
+            if self.workers > 1 and len(pending_urls) > 1:
+                print(f"🧵 Using {self.workers} worker processes")
+                fetched = self._process_collection_urls_in_pool(pending_urls)
+            else:
+                fetched = (
+                    (collection_url, self.process_collection_url(collection_url, page_html))
+                    for collection_url, page_html in self._prefetch_collection_html(pending_urls)
+                )
+            results = self._enrich_ahead(itertools.chain(cached_results, self._store_in_cache(fetched)))
+            
+            for i, (collection_url, item_data) in enumerate(results, 1):
+                if self._closed:
+                    print(f"\n⏹️  Scraper closed - stopping after {i - 1}/{len(all_collection_urls)} URLs")
+                    break
                 try:
-                    print(f"\n🔄 Processing {i}/{len(all_collection_urls)}: {collection_url}")
-                    
-                    # Navigate to collection page with retry and crash recovery
-                    navigation_success = False
-                    for retry in range(3):  # Try 3 times instead of 2
-                        try:
-                            self.driver.get(collection_url)
-                            time.sleep(2)  # Longer wait for page load
-                            navigation_success = True
-                            break
-                        except Exception as nav_error:
-                            error_msg = str(nav_error)
-                            print(f"⚠️  Navigation attempt {retry + 1} failed: {nav_error}")
-                            
-                            # Check for Chrome crash and restart driver
-                            if "tab crashed" in error_msg.lower() or "session deleted" in error_msg.lower():
-                                print("🔄 Chrome crashed - restarting WebDriver...")
-                                try:
-                                    if self.driver:
-                                        self.driver.quit()
-                                except:
-                                    pass
-                                self.setup_driver()
-                                if not self.driver:
-                                    print("❌ Failed to restart WebDriver")
-                                    break
-                                    
-                            if retry < 2:  # Don't wait on final attempt
-                                time.sleep(3)  # Longer wait before retry
-                    
-                    if not navigation_success:
-                        print(f"❌ Failed to navigate to {collection_url} after retries")
-                        failed_count += 1
-                        continue
-                    
-                    # Extract item data with error handling
-                    try:
-                        item_data = self.extract_item_data_from_page(collection_url)
-                    except Exception as extract_error:
-                        print(f"⚠️  Data extraction failed: {extract_error}")
-                        failed_count += 1
-                        continue
+                    if self.verbose:
+                        print(f"\n🔄 Processed {i}/{len(all_collection_urls)}: {collection_url}")
                     
                     if not item_data:
                         print(f"❌ Failed to extract data")
@@ -937,15 +1639,9 @@ class NiftyGatewayScraper:
                         failed_count += 1
                         continue
                         
-                    # Check if this is a collection item (we need contract_info for validation)
-                    try:
-                        contract_info = self.extract_contract_and_id(collection_url)
-                        if contract_info['url_type'] != 'collection':
-                            print(f"⚠️  Not a collection item")
-                            failed_count += 1
-                            continue
-                    except Exception as contract_error:
-                        print(f"⚠️  Contract validation failed: {contract_error}")
+                    # Check if this is a collection item (parsed when item_data was built)
+                    if item_data.get('url_type') != 'collection':
+                        print(f"⚠️  Not a collection item")
                         failed_count += 1
                         continue
                         
@@ -955,77 +1651,38 @@ class NiftyGatewayScraper:
                         failed_count += 1
                         continue
                     
-                    # Build the actual marketplace URL for the cheapest item
-                    try:
-                        if actual_token_id:
-                            item_data['actual_marketplace_url'] = f"https://www.niftygateway.com/marketplace/item/{item_data['contract']}/{actual_token_id}/"
-                            
-                            # Enrich with OpenSea collection data if enabled
-                            if self.enable_opensea_enrichment and self.opensea_client:
-                                try:
-                                    print(f"🔗 Enriching item with OpenSea data...")
-                                    item_data = self.opensea_client.enrich_item_with_collection_info(item_data)
-                                except Exception as opensea_error:
-                                    print(f"⚠️  OpenSea enrichment failed: {opensea_error}")
-                                    # Continue without enrichment
-                            
-                            # Analyze arbitrage opportunities if enabled and we have collection data
-                            if (self.enable_arbitrage_analysis and self.offers_client and 
-                                'collection_slug' in item_data and item_data.get('collection_slug') not in ['unknown', 'not-found']):
-                                try:
-                                    print(f"💎 Analyzing arbitrage opportunity...")
-                                    item_data = self.offers_client.enrich_item_with_arbitrage_data(item_data)
-                                    
-                                    # Fire real-time callback for arbitrage opportunities
-                                    if (self.arbitrage_callback and 
-                                        item_data.get('arbitrage_flag') and 
-                                        item_data.get('arbitrage_flag') != "⚫ NO_OFFER"):
-                                        try:
-                                            self.arbitrage_callback(item_data)
-                                            print(f"🔥 Real-time arbitrage alert sent: {item_data.get('arbitrage_flag')}")
-                                        except Exception as callback_error:
-                                            print(f"⚠️  Callback failed: {callback_error}")
-                                            
-                                except Exception as arbitrage_error:
-                                    print(f"⚠️  Arbitrage analysis failed: {arbitrage_error}")
-                                    # Continue without arbitrage data
-                            
-                            # Only save items that have OpenSea offers when arbitrage analysis is enabled
-                            should_save_item = True
-                            if self.enable_arbitrage_analysis:
-                                # Check if item has actual offer data (not just NO_OFFER flag)
-                                has_offer = (item_data.get('opensea_offer_data') is not None and 
-                                           item_data.get('arbitrage_flag') != "⚫ NO_OFFER")
-                                
-                                if not has_offer:
-                                    print(f"⏭️  Skipping item (no OpenSea offers found)")
-                                    should_save_item = False
-                            
-                            if should_save_item:
-                                self.scraped_items.append(item_data)
-                                scraped_count += 1
-                                
-                                # Enhanced success message with collection info and arbitrage flag if available
-                                collection_info = ""
-                                arbitrage_info = ""
-                                
-                                if 'collection_name' in item_data:
-                                    collection_info = f" - Collection: {item_data['collection_name']}"
-                                
-                                if 'arbitrage_flag' in item_data:
-                                    flag = item_data['arbitrage_flag']
-                                    if flag != "⚫ NO_OFFER":
-                                        profit_pct = item_data.get('profit_percentage', 0)
-                                        arbitrage_info = f" - {flag} ({profit_pct:+.1f}%)"
-                                
-                                print(f"✅ Scraped item {scraped_count}: Floor: ${item_data['floor_price']} - Token: #{actual_token_id}{collection_info}{arbitrage_info}")
-                    except Exception as url_error:
-                        print(f"⚠️  URL construction failed: {url_error}")
-                        failed_count += 1
-                        continue
+                    # OpenSea enrichment and arbitrage analysis already ran in _enrich_ahead
+                    
+                    # Only save items that have OpenSea offers when arbitrage analysis is enabled
+                    should_save_item = True
+                    if self.enable_arbitrage_analysis:
+                        # Check if item has actual offer data (not just NO_OFFER flag)
+                        has_offer = (item_data.get('opensea_offer_data') is not None and 
+                                   item_data.get('arbitrage_flag') != "⚫ NO_OFFER")
+                        
+                        if not has_offer:
+                            print(f"⏭️  Skipping item (no OpenSea offers found)")
+                            should_save_item = False
                     
-                    # Brief pause between requests
-                    time.sleep(0.5)
+                    if should_save_item:
+                        self.scraped_items.append(item_data)
+                        self._stream_item(item_data)
+                        scraped_count += 1
+                        
+                        # Enhanced success message with collection info and arbitrage flag if available
+                        collection_info = ""
+                        arbitrage_info = ""
+                        
+                        if 'collection_name' in item_data:
+                            collection_info = f" - Collection: {item_data['collection_name']}"
+                        
+                        if 'arbitrage_flag' in item_data:
+                            flag = item_data['arbitrage_flag']
+                            if flag != "⚫ NO_OFFER":
+                                profit_pct = item_data.get('profit_percentage', 0)
+                                arbitrage_info = f" - {flag} ({profit_pct:+.1f}%)"
+                        
+                        print(f"✅ Scraped item {scraped_count}: Floor: ${item_data['floor_price']} - Token: #{actual_token_id}{collection_info}{arbitrage_info}")
                     
                     # Progress update every 10 items
                     if i % 10 == 0:
@@ -1054,12 +1711,13 @@ class NiftyGatewayScraper:
             print("🔄 Returning any items scraped so far...")
             return self.scraped_items
 
-    def collect_all_urls_with_scrolling(self, max_scrolls: int = 20) -> List[str]:
+    def collect_all_urls_with_scrolling(self, max_scrolls: int = 20, target: int = 0) -> List[str]:
         """
         Aggressively collect ALL collection URLs by scrolling until no more content loads
         
         Args:
             max_scrolls: Maximum scroll attempts
+            target: Stop as soon as this many URLs are collected (0 = no limit)
             
         Returns:
             List of all unique collection URLs found
@@ -1068,16 +1726,43 @@ class NiftyGatewayScraper:
         scroll_attempts = 0
         consecutive_no_new = 0
         
+        def target_reached() -> bool:
+            return 0 < target <= len(all_urls)
+        
+        last_state = None
+        
+        def collect_new_urls() -> int:
+            # Skip the full href read when the link list has not changed since the last one
+            nonlocal last_state
+            state = self.driver.execute_script(LINK_STATE_JS)
+            if state == last_state:
+                return 0
+            last_state = state
+            # Only hrefs the page has not handed back yet cross the wire
+            try:
+                fresh = self.driver.execute_script(NEW_COLLECTION_HREFS_JS, False)
+            except Exception as e:
+                print(f"Error getting collection URLs: {e}")
+                return 0
+            seen = len(all_urls)
+            all_urls.update(fresh)
+            return len(all_urls) - seen
+        
         try:
             print("🔄 Starting aggressive URL collection...")
             
-            # Initial collection
-            initial_urls = self.get_all_collection_urls_on_page()
+            # Initial collection (resets the page-side seen-set)
+            try:
+                initial_urls = self.driver.execute_script(NEW_COLLECTION_HREFS_JS, True)
+            except Exception as e:
+                print(f"Error getting collection URLs: {e}")
+                initial_urls = []
             all_urls.update(initial_urls)
             print(f"📦 Initial load: {len(initial_urls)} URLs")
             
-            while scroll_attempts < max_scrolls and consecutive_no_new < 3:
-                print(f"\n📜 Scroll attempt {scroll_attempts + 1}/{max_scrolls}")
+            while scroll_attempts < max_scrolls and consecutive_no_new < 3 and not target_reached():
+                if self.verbose:
+                    print(f"\n📜 Scroll attempt {scroll_attempts + 1}/{max_scrolls}")
                 
                 urls_before = len(all_urls)
                 
@@ -1085,52 +1770,53 @@ class NiftyGatewayScraper:
                 scroll_success = False
                 
                 # Strategy 1: Scroll to bottom and wait
-                print("  📍 Strategy 1: Scroll to bottom")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                if self.verbose:
+                    print("  📍 Strategy 1: Scroll to bottom")
+                # Returns as soon as new links are added, or after 3s
+                self._trigger_and_wait_for_items(3)
                 
-                current_urls = self.get_all_collection_urls_on_page()
-                new_urls_count = len(set(current_urls) - all_urls)
-                all_urls.update(current_urls)
+                new_urls_count = collect_new_urls()
                 
                 if new_urls_count > 0:
-                    print(f"    ✅ Found {new_urls_count} new URLs")
+                    if self.verbose:
+                        print(f"    ✅ Found {new_urls_count} new URLs")
                     scroll_success = True
                 else:
                     # Strategy 2: Multiple small scrolls
-                    print("  📍 Strategy 2: Progressive scrolling")
-                    current_position = self.driver.execute_script("return window.pageYOffset")
+                    if self.verbose:
+                        print("  📍 Strategy 2: Progressive scrolling")
                     
                     for step in range(5):
-                        scroll_amount = 1000 + (step * 500)
-                        new_position = current_position + scroll_amount
-                        self.driver.execute_script(f"window.scrollTo(0, {new_position});")
-                        time.sleep(1)
+                        # 1000px below the starting position, then 500px further each step
+                        scroll_amount = 1000 if step == 0 else 500
+                        scroll_state = self.driver.execute_script(SCROLL_BY_JS, scroll_amount)
+                        new_position = scroll_state['y']
+                        self._wait_for_more_links(scroll_state['n'], 1)
                         
-                        step_urls = self.get_all_collection_urls_on_page()
-                        step_new_count = len(set(step_urls) - all_urls)
-                        all_urls.update(step_urls)
+                        step_new_count = collect_new_urls()
                         
                         if step_new_count > 0:
-                            print(f"    ✅ Found {step_new_count} new URLs at position {new_position}")
+                            if self.verbose:
+                                print(f"    ✅ Found {step_new_count} new URLs at position {new_position}")
                             scroll_success = True
                             break
                 
                 # Strategy 3: Page down keys if other methods fail
                 if not scroll_success:
-                    print("  📍 Strategy 3: Keyboard navigation")
+                    if self.verbose:
+                        print("  📍 Strategy 3: Keyboard navigation")
                     try:
                         body = self.driver.find_element(By.TAG_NAME, "body")
+                        link_count = self.driver.execute_script(COUNT_ELEMENTS_JS, COLLECTION_LINK_SELECTOR)
                         for key_attempt in range(10):
                             body.send_keys(Keys.PAGE_DOWN)
-                            time.sleep(0.5)
+                            link_count = self._wait_for_more_links(link_count, 0.5)
                             
-                            key_urls = self.get_all_collection_urls_on_page()
-                            key_new_count = len(set(key_urls) - all_urls)
-                            all_urls.update(key_urls)
+                            key_new_count = collect_new_urls()
                             
                             if key_new_count > 0:
-                                print(f"    ✅ Found {key_new_count} new URLs with PAGE_DOWN")
+                                if self.verbose:
+                                    print(f"    ✅ Found {key_new_count} new URLs with PAGE_DOWN")
                                 scroll_success = True
                                 break
                     except Exception as e:
@@ -1148,17 +1834,20 @@ class NiftyGatewayScraper:
                 
                 scroll_attempts += 1
                 
-                # Brief pause between scroll attempts
-                time.sleep(1)
-            
-            # Final collection attempt
-            print("\n🔍 Final URL sweep...")
-            final_urls = self.get_all_collection_urls_on_page()
-            final_new = len(set(final_urls) - all_urls)
-            all_urls.update(final_urls)
+                if target_reached():
+                    print(f"🎯 Reached {target} URLs - stopping scroll")
+                    break
             
-            if final_new > 0:
-                print(f"📦 Final sweep found {final_new} additional URLs")
+            # Final collection attempt (skipped when the last round already found nothing new)
+            if consecutive_no_new < 3 and not target_reached():
+                print("\n🔍 Final URL sweep...")
+                final_urls = self.get_all_collection_urls_on_page()
+                seen = len(all_urls)
+                all_urls.update(final_urls)
+                final_new = len(all_urls) - seen
+                
+                if final_new > 0:
+                    print(f"📦 Final sweep found {final_new} additional URLs")
             
             total_found = len(all_urls)
             print(f"\n📊 URL Collection Complete: {total_found} unique collection URLs found")
@@ -1176,38 +1865,31 @@ class NiftyGatewayScraper:
             List of unique collection URLs
         """
         try:
-            # Get all collection links with multiple selectors
-            collection_links = []
-            
-            selectors = [
-                "[href*='/marketplace/collection/']",
-                "a[href*='/marketplace/collection/']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    found_links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    collection_links.extend(found_links)
-                except:
-                    continue
-            
-            urls = set()
-            for link in collection_links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and '/marketplace/collection/' in href:
-                        # Normalize URL (remove query params, fragments)
-                        base_url = href.split('?')[0].split('#')[0]
-                        urls.add(base_url)
-                except:
-                    continue
-            
-            return list(urls)
+            # One round-trip for every normalized href instead of one get_attribute per link
+            hrefs = self.driver.execute_script(COLLECTION_HREFS_JS)
+            return list(dict.fromkeys(hrefs))
             
         except Exception as e:
             print(f"Error getting collection URLs: {e}")
             return []
     
+    def _stream_item(self, item_data: Dict):
+        """
+        Append one scraped item to the JSON Lines stream file, if enabled
+        
+        Args:
+            item_data: Item dictionary to write
+        """
+        if not self.stream_path or self._closed:
+            return
+        try:
+            if self._stream_file is None:
+                self._stream_file = open(self.stream_path, 'ab')
+            self._stream_file.write(_json_line(item_data))
+            self._stream_file.flush()
+        except OSError as e:
+            print(f"⚠️  Failed to stream item to {self.stream_path}: {e}")
+
     def save_to_csv(self, filename: str = None):
         """Save scraped data to CSV file"""
         try:
@@ -1216,8 +1898,12 @@ class NiftyGatewayScraper:
                 filename = f"nifty_gateway_items_{timestamp}.csv"
             
             if self.scraped_items:
-                df = pd.DataFrame(self.scraped_items)
-                df.to_csv(filename, index=False)
+                # Union of keys in first-seen order: enriched items carry extra columns
+                fieldnames = list(dict.fromkeys(key for item in self.scraped_items for key in item))
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(self.scraped_items)
                 print(f"✅ Data saved to {filename}")
             else:
                 print("⚠️  No data to save")
@@ -1233,8 +1919,12 @@ class NiftyGatewayScraper:
                 filename = f"nifty_gateway_items_{timestamp}.json"
             
             if self.scraped_items:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.scraped_items, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    with open(filename, 'wb', buffering=1 << 16) as f:
+                        f.write(orjson.dumps(self.scraped_items, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(self.scraped_items, f, indent=2, ensure_ascii=False)
                 print(f"✅ Data saved to {filename}")
             else:
                 print("⚠️  No data to save")
@@ -1242,16 +1932,53 @@ class NiftyGatewayScraper:
         except Exception as e:
             print(f"❌ Failed to save JSON file: {e}")
     
+    def save_to_ndjson(self, filename: str = None):
+        """Save scraped data as newline-delimited JSON, one item per line"""
+        save_items_to_ndjson(self.scraped_items, filename)
+    
     def close(self):
-        """Close the browser driver"""
+        """
+        Close the browser driver, the stream file and the result cache
+        
+        Work still running on other threads stops at its next URL and does not
+        start a new browser; use the scraper as a context manager to reopen it.
+        """
+        self._closed = True
+        
+        if self._stream_file is not None:
+            self._stream_file.close()
+            self._stream_file = None
+        
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+        
+        if self._pool is not None:
+            # A clean shutdown lets each worker's finalizer quit its browser
+            pool, self._pool = self._pool, None
+            try:
+                pool.close()
+                pool.join()
+            except Exception as e:
+                print(f"⚠️  Error closing worker pool: {e}")
+                pool.terminate()
+        
         try:
             if self.driver:
                 self.driver.quit()
                 print("✅ WebDriver closed successfully")
         except Exception as e:
             print(f"⚠️  Error closing WebDriver: {e}")
+        finally:
+            # Allow the scraper to be re-entered with a fresh browser
+            self.driver = None
     
     def __enter__(self):
+        # Start the browser once for the whole with-block so every
+        # scrape_items() call inside it reuses the same session
+        self._closed = False
+        if self.driver is None:
+            self.setup_driver()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -1261,6 +1988,135 @@ class NiftyGatewayScraper:
         return False  # Don't suppress exceptions
 
 
+# Per-process scraper used by pool workers
+_worker_scraper = None
+
+
+def _init_worker(headless: bool, http_fast_path: bool, verbose: bool, cookies: List[tuple]):
+    """Create this worker's scraper; its browser is started on first use"""
+    global _worker_scraper
+    _worker_scraper = NiftyGatewayScraper(
+        headless=headless,
+        enable_opensea_enrichment=False,
+        enable_arbitrage_analysis=False,
+        http_fast_path=http_fast_path,
+        workers=1,
+        verbose=verbose
+    )
+    for name, value, domain, path in cookies:
+        _worker_scraper.http_session.cookies.set(name, value, domain=domain, path=path)
+    # Pool workers skip atexit, so quit the browser through a multiprocessing finalizer
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+
+def scrape_one(url: str):
+    """
+    Process one collection URL in a pool worker
+    
+    Args:
+        url: Collection page URL
+        
+    Returns:
+        (url, item_data) tuple; enrichment happens in the parent process
+    """
+    return url, _worker_scraper.process_collection_url(url)
+
+
+class BrowserPool:
+    """
+    Bounded pool of browser-backed scrapers for scraping several start URLs at once
+    
+    Each worker thread lazily creates its own NiftyGatewayScraper (and Chrome
+    instance) on first use and keeps it for later submissions, so page loads
+    in one browser overlap with scrolling and extraction in the others.
+    """
+    
+    def __init__(self, max_workers: int = 3, **scraper_kwargs):
+        """
+        Initialize the pool
+        
+        Args:
+            max_workers: Maximum number of concurrent browsers
+            **scraper_kwargs: Passed to every NiftyGatewayScraper the pool creates
+                (workers is forced to 1: one browser per pool thread, and no
+                process pools forked from worker threads)
+        """
+        self.max_workers = max(1, max_workers)
+        self.scraper_kwargs = {**scraper_kwargs, 'workers': 1}
+        
+        # One set of OpenSea clients for every browser, so the API key sees a
+        # single rate limit and collection lookups are cached once
+        if scraper_kwargs.get('enable_opensea_enrichment', True) and OpenSeaAPIClient and 'opensea_client' not in scraper_kwargs:
+            try:
+                self.scraper_kwargs['opensea_client'] = OpenSeaAPIClient()
+            except Exception as e:
+                print(f"⚠️  Failed to initialize shared OpenSea client: {e}")
+        if scraper_kwargs.get('enable_arbitrage_analysis', True) and OpenSeaOffersClient and 'offers_client' not in scraper_kwargs:
+            try:
+                self.scraper_kwargs['offers_client'] = OpenSeaOffersClient()
+            except Exception as e:
+                print(f"⚠️  Failed to initialize shared OpenSea offers client: {e}")
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="browser")
+        self._local = threading.local()
+        self._scrapers: List[NiftyGatewayScraper] = []
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def _get_scraper(self) -> 'NiftyGatewayScraper':
+        """Return this worker thread's scraper, creating it on first use"""
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                scraper = NiftyGatewayScraper(**self.scraper_kwargs)
+                self._scrapers.append(scraper)
+            self._local.scraper = scraper
+        return scraper
+    
+    def _scrape(self, url: str, max_items: int, max_scrolls: int) -> List[Dict]:
+        scraper = self._get_scraper()
+        # scraped_items accumulates across calls; hand back only this URL's items
+        start = len(scraper.scraped_items)
+        items = scraper.scrape_items(url, max_items=max_items, max_scrolls=max_scrolls)
+        return list(items[start:])
+    
+    def submit(self, url: str, max_items: int = 100, max_scrolls: int = 20) -> Future:
+        """
+        Queue a start URL for scraping
+        
+        Args:
+            url: NiftyGateway URL to scrape
+            max_items: Maximum number of items to scrape
+            max_scrolls: Maximum number of scroll attempts
+            
+        Returns:
+            Future resolving to the list of item dictionaries for this URL
+        """
+        return self._executor.submit(self._scrape, url, max_items, max_scrolls)
+    
+    def close(self):
+        """
+        Cancel queued work and close every browser the pool started
+        
+        Does not wait for in-flight scrapes, so Ctrl-C stops the scanner promptly;
+        quitting their browsers makes those scrapes end early.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._closed = True
+            scrapers, self._scrapers = self._scrapers, []
+        for scraper in scrapers:
+            scraper.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
 def main():
     """Main function to run the scraper"""
     try:
@@ -1280,11 +2136,12 @@ def main():
                     try:
                         scraper.save_to_csv()
                         scraper.save_to_json()
+                        scraper.save_to_ndjson()
                         
                         # Print summary
                         print(f"\n=== SCRAPING SUMMARY ===")
                         print(f"Total items scraped: {len(items)}")
-                        print(f"Items with floor prices: {len([item for item in items if item.get('floor_price')])}")
+                        print(f"Items with floor prices: {sum(1 for item in items if item.get('floor_price'))}")
                         
                         # Show first few items
                         print(f"\n=== FIRST 3 ITEMS ===")
@@ -1310,6 +2167,7 @@ def main():
                     try:
                         scraper.save_to_csv()
                         scraper.save_to_json()
+                        scraper.save_to_ndjson()
                         print("✅ Partial results saved")
                     except Exception as save_error:
                         print(f"⚠️  Could not save partial results: {save_error}")
@@ -1322,6 +2180,7 @@ def main():
                     try:
                         scraper.save_to_csv()
                         scraper.save_to_json()
+                        scraper.save_to_ndjson()
                         print("✅ Partial results saved")
                     except Exception as save_error:
                         print(f"⚠️  Could not save partial results: {save_error}")
@@ -3,9 +3,10 @@ OpenSea API client for fetching collection information
 """
 
 import requests
+import threading
 import time
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 # Setup logging
@@ -32,17 +33,30 @@ class OpenSeaAPIClient:
             "x-api-key": self.api_key
         }
         
-        # Track last request time for rate limiting
+        # Reuse one keep-alive connection to the API across lookups
+        self.session = requests.Session()
+        
+        # Track last request time for rate limiting; the lock lets scrapers on
+        # several threads share one client (and one rate limit)
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+        
+        # Collection name/slug per contract; they don't change between scans,
+        # so repeat lookups skip the API (and its rate limit) entirely
+        self._collection_cache: Dict[str, Tuple[str, str]] = {}
         
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits"""
-        time_since_last = time.time() - self.last_request_time
-        min_interval = 1.0 / self.rate_limit  # 0.25 seconds for 4 req/sec
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            time.sleep(sleep_time)
+        with self._rate_limit_lock:
+            time_since_last = time.time() - self.last_request_time
+            min_interval = 1.0 / self.rate_limit  # 0.25 seconds for 4 req/sec
+            
+            if time_since_last < min_interval:
+                sleep_time = min_interval - time_since_last
+                time.sleep(sleep_time)
+            
+            # Claim this slot before releasing the lock so concurrent callers queue up
+            self.last_request_time = time.time()
     
     def get_collection_info(self, contract_address: str, retries: int = 0) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -58,6 +72,10 @@ class OpenSeaAPIClient:
         if not contract_address:
             logger.warning("Empty contract address provided")
             return None, None
+        
+        cached = self._collection_cache.get(contract_address)
+        if cached is not None:
+            return cached
             
         # Rate limiting
         self._wait_for_rate_limit()
@@ -67,7 +85,7 @@ class OpenSeaAPIClient:
         try:
             logger.debug(f"Fetching collection info for contract: {contract_address}")
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             self.last_request_time = time.time()
             
             if response.status_code == 200:
@@ -76,6 +94,7 @@ class OpenSeaAPIClient:
                 collection_slug = data.get('collection', 'unknown')
                 
                 logger.debug(f"✅ Retrieved: {collection_name} ({collection_slug})")
+                self._collection_cache[contract_address] = (collection_name, collection_slug)
                 return collection_name, collection_slug
             
             elif response.status_code == 429:  # Rate limited
@@ -90,6 +109,7 @@ class OpenSeaAPIClient:
             
             elif response.status_code == 404:
                 logger.warning(f"⚠️  Contract {contract_address} not found on OpenSea")
+                self._collection_cache[contract_address] = ("Not Found", "not-found")
                 return "Not Found", "not-found"
             
             else:
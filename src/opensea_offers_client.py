@@ -3,6 +3,7 @@ OpenSea Offers API client for fetching top offers and calculating arbitrage oppo
 """
 
 import requests
+import threading
 import time
 import logging
 from typing import Optional, Dict, Tuple
@@ -33,25 +34,34 @@ class OpenSeaOffersClient:
             "x-api-key": self.api_key
         }
         
+        # Reuse keep-alive connections to OpenSea and CoinGecko across lookups
+        self.session = requests.Session()
+        
         # ETH price caching
         self.eth_price_usd = None
         self.eth_price_last_updated = None
         self.eth_price_cache_minutes = 1  # Update ETH price every minute
         
-        # Track last request time for rate limiting
+        # Track last request time for rate limiting; the lock lets scrapers on
+        # several threads share one client (and one rate limit)
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
         
         # Initialize ETH price
         self.update_eth_price()
         
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits"""
-        time_since_last = time.time() - self.last_request_time
-        min_interval = 1.0 / self.rate_limit  # 0.25 seconds for 4 req/sec
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            time.sleep(sleep_time)
+        with self._rate_limit_lock:
+            time_since_last = time.time() - self.last_request_time
+            min_interval = 1.0 / self.rate_limit  # 0.25 seconds for 4 req/sec
+            
+            if time_since_last < min_interval:
+                sleep_time = min_interval - time_since_last
+                time.sleep(sleep_time)
+            
+            # Claim this slot before releasing the lock so concurrent callers queue up
+            self.last_request_time = time.time()
     
     def update_eth_price(self) -> bool:
         """
@@ -68,7 +78,7 @@ class OpenSeaOffersClient:
             
             # Fetch current ETH price from CoinGecko (free API, no key required)
             url = "https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -165,7 +175,7 @@ class OpenSeaOffersClient:
         try:
             logger.debug(f"Fetching best offer for {collection_slug}/{token_id}")
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             self.last_request_time = time.time()
             
             if response.status_code == 200:
@@ -9,21 +9,22 @@ import json
 import argparse
 import time
 from datetime import datetime
-from nifty_scraper import NiftyGatewayScraper
+from nifty_scraper import NiftyGatewayScraper, BrowserPool, save_items_to_ndjson
 from discord_notifier import DiscordNotifier
 import config
 
 # Discord webhook URL for arbitrage alerts
 DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/1401964079651754076/dQVdnPAIdyBI4NUIh8ISmJr7uGqp4-Hhk264Y5y8j5IqfK-I_V9PzA7yAmGA8WDVcv2k"
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(description='NiftyGateway Arbitrage Scanner with Discord Alerts')
     parser.add_argument('--max-items', type=int, default=0, 
                        help='Maximum number of items to scan (0 = unlimited, default: unlimited)')
     parser.add_argument('--headless', action='store_true', 
                        help='Run browser in headless mode (recommended for production)')
     parser.add_argument('--start-url', type=str, default=config.BASE_URL,
-                       help='Starting URL for scanning (default from config)')
+                       help='Starting URL for scanning, or several separated by commas (default from config)')
     parser.add_argument('--max-scrolls', type=int, default=50,
                        help='Maximum number of scroll attempts (default: 50)')
     parser.add_argument('--no-opensea-enrichment', action='store_true',
@@ -34,10 +35,31 @@ def main():
                        help='Run continuously, rescanning after completion')
     parser.add_argument('--scan-interval', type=int, default=10,
                        help='Interval between scans in continuous mode (seconds, default: 10)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Browser processes for collection pages with a single --start-url (default: MORPH_PROCESSES env var, or 1; multiple start URLs use one browser each)')
+    parser.add_argument('--cache-db', type=str, default=None,
+                       help='SQLite file caching collection page results between scans')
+    parser.add_argument('--cache-ttl', type=float, default=60,
+                       help='Seconds a cached listing price/token is reused before the page is re-read (default: 60)')
+    parser.add_argument('--stream-output', type=str, default=None,
+                       help='Append each scraped item to this JSON Lines file as soon as it is found')
+    parser.add_argument('--ndjson', type=str, default=None,
+                       help='Write each completed scan to this NDJSON file, replacing the previous scan')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Skip per-URL and per-scroll-step progress lines')
+    return parser
+
+def main(argv=None):
+    """
+    Run the scanner
     
-    args = parser.parse_args()
+    Args:
+        argv: Argument list to parse instead of sys.argv (for calling from another process)
+    """
+    args = _build_parser().parse_args(argv)
     
     enable_opensea = not args.no_opensea_enrichment
+    start_urls = [url.strip() for url in args.start_url.split(',') if url.strip()]
     enable_arbitrage = not args.no_arbitrage_analysis
     
     if not enable_arbitrage:
@@ -56,14 +78,14 @@ Mode: REAL-TIME Discord alerts for arbitrage opportunities
 Configuration:
   Max items: {'Unlimited' if args.max_items == 0 else args.max_items}
   Headless mode: {args.headless}
-  Starting URL: {args.start_url}
+  Starting URL{'s' if len(start_urls) > 1 else ''}: {', '.join(start_urls)}
   Max scrolls: {args.max_scrolls}
   OpenSea enrichment: {'Enabled' if enable_opensea else 'Disabled'}
   Arbitrage analysis: {'Enabled' if enable_arbitrage else 'Disabled'}
   Continuous mode: {'Enabled' if args.continuous else 'Disabled'}
   
 🎯 Watching for: 🔥 RED, 🟡 YELLOW, 🟢 GREEN opportunities
-💬 Discord alerts: INSTANT (sent as soon as found)
+💬 Discord alerts: BATCHED (sent within {discord.batch_delay:g}s of being found)
 ==========================================================
 """)
     
@@ -87,12 +109,22 @@ Configuration:
             print(f"🚨 REAL-TIME ALERT: {arbitrage_flag} - {collection_name} #{token_id} - {profit_pct:+.1f}% (${profit_usd:+.2f})")
     
     # Initialize scraper with real-time callback
-    scraper = NiftyGatewayScraper(
+    scraper_kwargs = dict(
         headless=args.headless, 
         enable_opensea_enrichment=enable_opensea,
         enable_arbitrage_analysis=enable_arbitrage,
-        arbitrage_callback=arbitrage_callback
+        arbitrage_callback=arbitrage_callback,
+        workers=args.workers,
+        cache_path=args.cache_db,
+        cache_ttl=args.cache_ttl,
+        stream_path=args.stream_output,
+        verbose=not args.quiet
     )
+    if len(start_urls) > 1:
+        # One browser per start URL, up to 3, scraping concurrently
+        scraper = BrowserPool(max_workers=min(3, len(start_urls)), **scraper_kwargs)
+    else:
+        scraper = NiftyGatewayScraper(**scraper_kwargs)
     
     # Opportunity counters
     session_opportunities = 0
@@ -107,11 +139,21 @@ Configuration:
         while True:  # Main scanning loop
             # Run the scraper
             max_items_to_use = None if args.max_items == 0 else args.max_items
-            scraped_items = scraper.scrape_items(
-                url=args.start_url,
-                max_items=max_items_to_use or 999999,  # Use large number if unlimited
-                max_scrolls=args.max_scrolls
-            )
+            max_items_to_use = max_items_to_use or 999999  # Use large number if unlimited
+            if isinstance(scraper, BrowserPool):
+                futures = [
+                    scraper.submit(url, max_items=max_items_to_use, max_scrolls=args.max_scrolls)
+                    for url in start_urls
+                ]
+                scraped_items = []
+                for future in futures:
+                    scraped_items.extend(future.result())
+            else:
+                scraped_items = scraper.scrape_items(
+                    url=start_urls[0],
+                    max_items=max_items_to_use,
+                    max_scrolls=args.max_scrolls
+                )
             
             if scraped_items:
                 total_processed += len(scraped_items)
@@ -151,7 +193,11 @@ Configuration:
 ==========================================================
 """)
                 
-                # Send summary to Discord
+                if args.ndjson:
+                    save_items_to_ndjson(scraped_items, args.ndjson)
+                
+                # Send any batched alerts, then the summary, to Discord
+                discord.flush()
                 discord.send_summary_message(
                     total_processed=len(scraped_items),
                     opportunities_found=scan_opportunities,
@@ -184,6 +230,7 @@ Configuration:
     finally:
         # Always close the scraper
         scraper.close()
+        discord.close()
         print("🔧 Scanner closed.")
 
 if __name__ == "__main__":